@@ -2,21 +2,26 @@
 Celery Scheduler Main
 """
 
+from datetime import datetime
 from typing import cast
 
 from celery import Celery, Task, current_app, shared_task
 from celery.result import AsyncResult
+from celery.utils import uuid
 
 from common.models.enums import Vendors
 from common.tools import TMFLogger
 from inventory_agent.models.disable_initial_population import DisableInitialPopulation
 
+from .dispatch_policy import get_dispatch_policy
+from .execution_slots import ExecutionSlots
 from .messages import CelerySchedulerMessages as Messages
 from .models import TaskStatus
+from .pending_index import PendingJobIndex
 from .redis.util import (
     ExecutedQueue,
     ExecutingQueue,
-    PendingQueue,
+    PendingJob,
     celery_queue_length,
     get_disable_initial_population,
     set_disable_initial_population,
@@ -64,38 +69,43 @@ def enable_scheduled_tasks_by_vendor(vendor: str) -> None:
 def common_run_scheduler_by_vendor(vendor: str) -> None:
     """
     Sends the specific tasks for each vendor on their queue
-    It checks if there are vendor tasks on the pending queue
-    and disables other tasks for that vendor
-    """
-    if (
-        PendingQueue.exists()
-        and PendingQueue.exists_by_vendor(vendor)
-        and celery_queue_length(vendor) < DEFAULT_THRESHOLD
-    ):
-        try:
-            disable_run_entity_task_by_vendor(vendor)
-        except KeyError:
-            logger.log(
-                Messages.SCHEDULER_ENTRY_VALUE_ERROR,
-                redis_key="redbeat:" + RUN_SCHEDULER_ENTITY_TASK,
-            )
-            return
-
-        next_job = PendingQueue.remove_first_by_vendor(vendor)
-        if next_job is None:
-            return
+    The dispatch policy atomically takes the next vendor tasks from the pending
+    queue into the free vendor execution slots while the celery queue is not
+    full, other tasks for that vendor are disabled once all its slots are held.
+    A job is marked as started once sent, otherwise it goes back to the
+    pending queue when its start timeout expires.
+    """
+    policy = get_dispatch_policy()
+    while (dispatch := policy.pop(vendor, DEFAULT_THRESHOLD, uuid())) is not None:
+        next_job = dispatch.job
         scheduled_task: Task = cast(Celery, current_app).signature(next_job.name)
-        res: AsyncResult = scheduled_task.apply_async(queue=vendor)
+        res: AsyncResult = scheduled_task.apply_async(
+            queue=vendor, task_id=next_job.job_id
+        )
         job_id = str(res.id)
         ExecutingQueue.add(next_job, job_id)
+        ExecutionSlots.mark_started(vendor, next_job.slot, job_id)
         logger.log(
             Messages.JOB_EXECUTION_STARTED,
             task_name=next_job.name,
             task_queue=next_job.job_queue,
             task_id=job_id,
             scheduled_time=next_job.jobReceiveDate,
+            wait_time=dispatch.wait_time,
+            slot=next_job.slot,
         )
 
+        if dispatch.free_slots == 0:
+            try:
+                disable_run_entity_task_by_vendor(vendor)
+            except KeyError:
+                # The execution slots already keep other ticks from dispatching
+                logger.log(
+                    Messages.SCHEDULER_ENTRY_VALUE_ERROR,
+                    redis_key="redbeat:" + RUN_SCHEDULER_ENTITY_TASK,
+                )
+            return
+
 
 @shared_task(
     name=INITIAL_SCHEDULER_CONTROLLER_TASK,
@@ -129,29 +139,31 @@ def start_scheduled_tasks_controller(self: Task, vendor=None) -> None:
 def common_scheduler_insert_into_buffer(name: str, queue: str) -> None:
     """
     Celery task that inserts into redis pending list (key: inventory-agent:pending-jobs)
-    a task.
+    a task, unless a task with the same name is already pending.
     """
-    pending_items = [item.name for item in PendingQueue.get_all()]
-    if name not in pending_items:
-        PendingQueue.add(name=name, job_queue=queue)
-    else:
+    job = PendingJob(name=name, job_queue=queue, jobReceiveDate=datetime.now())
+    if not PendingJobIndex.enqueue(job):
         logger.log(
             Messages.SKIP_SCHEDULED_TASK,
             task_name=name,
-            pending_items=len(pending_items),
+            pending_items=PendingJobIndex.count(),
         )
 
 
 @shared_task(name=RUN_SCHEDULER_ENTITY_TASK)
 def common_run_scheduler_entity(vendor_queue_ready: dict[str, bool]) -> None:
     """
-    Celery task that starts execution of the last task from pending list for each vendor
-    if the task is enabled for that vendor.
+    Celery task that starts execution of the next task from pending list for each vendor
+    if the task is enabled for that vendor, as chosen by the dispatch policy.
     (key: inventory-agent:pending-jobs)
     """
-    for vendor in get_enabled_vendors():
-        if vendor_queue_ready.get(vendor, False):
-            common_run_scheduler_by_vendor(vendor)
+    ready_vendors = [
+        vendor
+        for vendor in get_enabled_vendors()
+        if vendor_queue_ready.get(vendor, False)
+    ]
+    for vendor in get_dispatch_policy().order_vendors(ready_vendors):
+        common_run_scheduler_by_vendor(vendor)
 
 
 @shared_task(name=CHECK_SCHEDULER_ENTITY_TASK)
@@ -168,6 +180,7 @@ def common_check_scheduler_entity() -> None:
         task = ExecutingQueue.get_first()
         if celery_queue_length(task.job_queue) < DEFAULT_THRESHOLD:
             ExecutingQueue.remove_first()
+            ExecutionSlots.release(task.job_queue, task.job_id)
             TMFLogger().log(
                 Messages.JOB_FAILURE_UNTERMINATED,
                 name=task.name,
@@ -179,17 +192,28 @@ def common_check_scheduler_entity() -> None:
 
 
 @shared_task(name=UPDATE_SCHEDULER_ENTITY_TASK)
-def update_scheduler_entity_status(task_status: TaskStatus, vendor: str):
+def update_scheduler_entity_status(
+    task_status: TaskStatus, vendor: str, job_id: str | None = None
+):
     """
     Celery task that update task status to `COMPLETED` or `FAILED`
-    Mark Scheduler Entity as complete and continue
+    Mark Scheduler Entity as complete, free the execution slot of `job_id`
+    (the celery task id of the finished job, else the one of the first
+    executing job of the vendor) and dispatch the next job of the vendor
+    right away, the run_scheduler_entity beat is only a safety net
     """
     TMFLogger().log(Messages.SCHEDULED_POPULATION_COMPLETE, vendor=vendor)
-    if ExecutingQueue.exists():
-        current_job = ExecutingQueue.remove_first_by_vendor(vendor.upper())
-        if current_job:
-            ExecutedQueue.add(current_job, task_status)
-        enable_run_entity_task_by_vendor(vendor.upper())
+    vendor = vendor.upper()
+    if ExecutingQueue.exists() and (
+        current_job := ExecutingQueue.remove_first_by_vendor(vendor)
+    ):
+        ExecutedQueue.add(current_job, task_status)
+        if job_id is None:
+            job_id = current_job.job_id
+    if job_id is not None:
+        ExecutionSlots.release(vendor, job_id)
+    enable_run_entity_task_by_vendor(vendor)
+    common_run_scheduler_by_vendor(vendor)
 
 
 @shared_task(name=INITIAL_POPULATION_TASK)
@@ -0,0 +1,15 @@
+"""
+Meraki asyncio endpoint functions
+"""
+
+from . import appliance, devices, firewall, networks, organizations
+from .cisco_meraki import AsyncSBMeraki
+
+__all__ = [
+    "AsyncSBMeraki",
+    "appliance",
+    "devices",
+    "firewall",
+    "networks",
+    "organizations",
+]
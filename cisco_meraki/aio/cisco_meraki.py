@@ -0,0 +1,178 @@
+"""
+Southbound asyncio interactions with the Meraki API
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Final, TypeVar
+
+from meraki import AsyncDashboardAPI
+from meraki.config import DEFAULT_BASE_URL
+
+from common.southbound.cisco_meraki.rate_limiter import MerakiRateLimiter
+from common.tools.tmf_logger import TMFLogger
+
+logger = TMFLogger()
+
+T = TypeVar("T")
+
+DEFAULT_ORGANIZATION_CONCURRENCY: Final[int] = 5
+DEFAULT_MAXIMUM_CONCURRENT_REQUESTS: Final[int] = 10
+
+
+class AsyncSBMeraki:
+    """
+    Class to Abstract Setting up and doing Operations using the Meraki asyncio API
+    The AsyncDashboardAPI is created on first use, inside the running event loop.
+    """
+
+    def __init__(
+        self,
+        host: str | None,
+        api_key: Callable[[], str] | str,
+        rate_limiter: MerakiRateLimiter | None = None,
+        organization_concurrency: int = DEFAULT_ORGANIZATION_CONCURRENCY,
+        maximum_concurrent_requests: int = DEFAULT_MAXIMUM_CONCURRENT_REQUESTS,
+    ):
+        if not api_key:
+            raise ValueError("Meraki token not provided")
+
+        self.host = host or DEFAULT_BASE_URL
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.organization_concurrency = organization_concurrency
+        self.maximum_concurrent_requests = maximum_concurrent_requests
+        self._meraki_client: AsyncDashboardAPI | None = None
+        self._meraki_client_loop: asyncio.AbstractEventLoop | None = None
+        self._organization_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._organization_semaphores_loop: asyncio.AbstractEventLoop | None = None
+        self._retiring_clients: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        """Use the client as an async context manager"""
+        return self
+
+    async def __aexit__(self, *_):
+        """Close the Meraki aiohttp session on exit"""
+        await self.close()
+
+    def __set_meraki_client(self, api_key: str):
+        try:
+            supress_logging = logger.get_log_level() != "DEBUG"
+        except AttributeError:
+            supress_logging = False
+
+        self._meraki_client = AsyncDashboardAPI(
+            base_url=self.host,
+            api_key=api_key,
+            output_log=False,
+            log_path="./logs/",
+            print_console=True,
+            maximum_retries=5,
+            inherit_logging_config=True,
+            retry_4xx_error=False,
+            suppress_logging=supress_logging,
+            maximum_concurrent_requests=self.maximum_concurrent_requests,
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.install_async(self._meraki_client, api_key)
+
+    @property
+    def api(self) -> AsyncDashboardAPI:
+        """
+        Get the Meraki asyncio Dashboard API
+        Its aiohttp session belongs to the event loop that opened it, so a new
+        client is created when called from a different running loop.
+
+        Returns:
+            meraki.AsyncDashboardAPI: the Meraki asyncio API
+        """
+        if isinstance(self.api_key, str):
+            token = self.api_key
+        else:
+            token = self.api_key()
+
+        loop = asyncio.get_running_loop()
+        if self._meraki_client is None or self._meraki_client_loop is not loop:
+            self.__set_meraki_client(token)
+            self._meraki_client_loop = loop
+        # pylint: disable-next=protected-access
+        elif self._meraki_client._session._api_key != token:
+            self.__retire_meraki_client(self._meraki_client)
+            self.__set_meraki_client(token)
+        return self._meraki_client
+
+    def __retire_meraki_client(self, meraki_client: AsyncDashboardAPI) -> None:
+        """
+        Close a superseded client in the background
+        once the requests in flight on it are done
+        """
+
+        async def close_when_idle():
+            # pylint: disable-next=protected-access
+            session = meraki_client._session
+            # pylint: disable-next=protected-access
+            semaphore = session._concurrent_requests_semaphore
+            for _ in range(self.maximum_concurrent_requests):
+                await semaphore.acquire()
+            await session.close()
+
+        task = asyncio.get_running_loop().create_task(close_when_idle())
+        self._retiring_clients.add(task)
+        task.add_done_callback(self._retiring_clients.discard)
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp sessions
+        """
+        loop = asyncio.get_running_loop()
+        if retiring := [t for t in self._retiring_clients if t.get_loop() is loop]:
+            await asyncio.gather(*retiring)
+        if self._meraki_client is not None:
+            if self._meraki_client_loop is asyncio.get_running_loop():
+                # pylint: disable-next=protected-access
+                await self._meraki_client._session.close()
+            self._meraki_client = None
+            self._meraki_client_loop = None
+
+    def organization_semaphore(self, organization_id: str) -> asyncio.Semaphore:
+        """
+        Semaphore bounding the in-flight calls made for one organization
+        """
+        loop = asyncio.get_running_loop()
+        if self._organization_semaphores_loop is not loop:
+            self._organization_semaphores = {}
+            self._organization_semaphores_loop = loop
+        if organization_id not in self._organization_semaphores:
+            self._organization_semaphores[organization_id] = asyncio.Semaphore(
+                self.organization_concurrency
+            )
+        return self._organization_semaphores[organization_id]
+
+    async def gather_for_organization(
+        self,
+        organization_id: str,
+        awaitables: Iterable[Awaitable[T]],
+        return_exceptions: bool = False,
+    ) -> list[T | BaseException]:
+        """
+        Await calls made for one organization, keeping at most
+        `organization_concurrency` of them in flight.
+        Results are returned in input order, as with asyncio.gather.
+
+        Example:
+            settings = await client.gather_for_organization(
+                org_id,
+                (get_l3_firewall_rules(client, network.id) for network in networks),
+            )
+        """
+        semaphore = self.organization_semaphore(organization_id)
+
+        async def bounded(awaitable: Awaitable[T]) -> T:
+            async with semaphore:
+                return await awaitable
+
+        return await asyncio.gather(
+            *(bounded(awaitable) for awaitable in awaitables),
+            return_exceptions=return_exceptions,
+        )
@@ -0,0 +1,133 @@
+"""
+Meraki asyncio API
+/devices Endpoint Functions
+"""
+
+from common.parsing import evaluate_model
+
+from .. import models
+from ..cisco_meraki import SBMeraki
+from .cisco_meraki import AsyncSBMeraki
+
+
+@SBMeraki.async_exception_handler
+async def get_device(client: AsyncSBMeraki, serial: str) -> models.DeviceBySerial:
+    """
+    API: /devices/{serial}
+    """
+    data = await client.api.devices.getDevice(serial)
+    return evaluate_model(models.DeviceBySerial, data)
+
+
+@SBMeraki.async_exception_handler
+async def get_management_interface(
+    client: AsyncSBMeraki, serial: str
+) -> models.DeviceManagementInterfaces:
+    """
+    API: /devices/{serial}/managementInterface
+    """
+    data = await client.api.devices.getDeviceManagementInterface(serial)
+    return evaluate_model(models.DeviceManagementInterfaces, data)
+
+
+@SBMeraki.async_exception_handler
+async def update_management_interface(
+    client: AsyncSBMeraki, serial: str, update_data: models.DeviceManagementInterfaces
+) -> models.DeviceManagementInterfaces:
+    """
+    API: /devices/{serial}/managementInterface
+    """
+    data = await client.api.devices.updateDeviceManagementInterface(
+        serial=serial, **update_data.dict(exclude_unset=True, by_alias=True)
+    )
+    return evaluate_model(models.DeviceManagementInterfaces, data)
+
+
+@SBMeraki.async_exception_handler
+async def update_device(
+    client: AsyncSBMeraki, serial: str, update_data: models.UpdateDeviceData
+) -> models.DeviceBySerial:
+    """
+    API: PUT /devices/{serial}
+    """
+    data = await client.api.devices.updateDevice(
+        serial, **update_data.dict(exclude_none=True)
+    )
+    return evaluate_model(models.DeviceBySerial, data)
+
+
+@SBMeraki.async_exception_handler
+async def get_device_loss_and_latency_history(
+    client: AsyncSBMeraki,
+    serial: str,
+    public_ip: str,
+    timespan: int,
+) -> list[models.DeviceLossAndLatencyHistory]:
+    """
+    API: /devices/{serial}/lossAndLatencyHistory
+    """
+    data = await client.api.devices.getDeviceLossAndLatencyHistory(
+        serial,
+        public_ip,
+        timespan=timespan,
+    )
+    return evaluate_model(list[models.DeviceLossAndLatencyHistory], data)
+
+
+@SBMeraki.async_exception_handler
+async def get_device_switch_ports_statuses(
+    client: AsyncSBMeraki,
+    serial: str,
+    timespan: int,
+) -> list[models.DeviceSwitchPortsStatuses]:
+    """
+    API: /switch/{serial}/deviceSwitchPortsStatuses
+    """
+    data = await client.api.switch.getDeviceSwitchPortsStatuses(
+        serial,
+        timespan=timespan,
+    )
+    return evaluate_model(list[models.DeviceSwitchPortsStatuses], data)
+
+
+@SBMeraki.async_exception_handler
+async def get_device_switch_ports_statuses_packets(
+    client: AsyncSBMeraki,
+    serial: str,
+    timespan: int,
+) -> list[models.DeviceSwitchPortsStatusesPackets]:
+    """
+    API: /switch/{serial}/deviceSwitchPortsStatusesPackets
+    """
+    data = await client.api.switch.getDeviceSwitchPortsStatusesPackets(
+        serial,
+        timespan=timespan,
+    )
+    return evaluate_model(list[models.DeviceSwitchPortsStatusesPackets], data)
+
+
+@SBMeraki.async_exception_handler
+async def get_switch_ports(
+    client: AsyncSBMeraki, serial: str
+) -> list[models.SwitchPort]:
+    """
+    API: /devices/{serial}/switch/ports
+    """
+    data = await client.api.switch.getDeviceSwitchPorts(serial)
+    return evaluate_model(list[models.SwitchPort], data)
+
+
+@SBMeraki.async_exception_handler
+async def update_switch_port(
+    client: AsyncSBMeraki,
+    serial: str,
+    port_id: str,
+    update_data: models.UpdateSwitchPortData,
+) -> models.SwitchPort:
+    """
+    API: /devices/{serial}/switch/ports/{portId}
+    """
+    data = await client.api.switch.updateDeviceSwitchPort(
+        serial, port_id, **update_data.dict(exclude_unset=True, by_alias=True)
+    )
+    return evaluate_model(models.SwitchPort, data)
@@ -11,6 +11,7 @@ from meraki.exceptions import APIError, APIKeyError, AsyncAPIError
 
 from common.southbound.cisco_meraki import exceptions
 from common.southbound.cisco_meraki.messages import MerakiMessages
+from common.southbound.cisco_meraki.rate_limiter import MerakiRateLimiter
 from common.southbound.exceptions import SouthboundBaseError
 from common.tools.tmf_logger import TMFLogger
 
@@ -34,7 +35,17 @@ class SBMeraki:
         "504": exceptions.InternalServerError,
     }
 
-    def __init__(self, host: str | None, api_key: Callable[[], str] | str):
+    def __init__(
+        self,
+        host: str | None,
+        api_key: Callable[[], str] | str,
+        rate_limiter: MerakiRateLimiter | None = None,
+    ):
+        """
+        SBMeraki Constructor
+        When a rate_limiter is given every Dashboard API request waits for
+        a token shared by all workers using the same API key and organization.
+        """
         if not api_key:
             raise ValueError("Meraki token not provided")
 
@@ -43,6 +54,7 @@ class SBMeraki:
         else:
             self.host = DEFAULT_BASE_URL
         self.api_key = api_key
+        self.rate_limiter = rate_limiter
         if isinstance(api_key, str):
             self.__set_meraki_client(api_key)
         else:
@@ -66,6 +78,8 @@ class SBMeraki:
             retry_4xx_error=False,
             suppress_logging=supress_logging,
         )
+        if self.rate_limiter is not None:
+            self.rate_limiter.install(self._meraki_client, api_key)
 
     @property
     def api(self) -> DashboardAPI:
@@ -91,6 +105,29 @@ class SBMeraki:
         status_code = str(status_code) if status_code else ""
         return SBMeraki.STATUS_CODE_TO_ERROR.get(status_code, exceptions.UnknownError)
 
+    @staticmethod
+    def translate_exception(
+        exc: APIKeyError | APIError | AsyncAPIError,
+    ) -> SouthboundBaseError:
+        """
+        Log a Meraki SDK exception and build the matching Southbound exception
+        """
+        if isinstance(exc, APIKeyError):
+            logger.log(MerakiMessages.APIKEY_NOT_SET_ERROR)
+            return exceptions.NoAPIKeyError(MerakiMessages.APIKEY_NOT_SET_ERROR.event)
+
+        logger.log(
+            MerakiMessages.MERAKI_UNSUPPORTED_OPERATION
+            if exc.status == 400
+            else MerakiMessages.MERAKI_RETURNED_ERROR,
+            error=str(exc),
+            message=exc.message,
+            status=exc.status,
+            operation=exc.operation,
+        )
+        exc_type = SBMeraki.code_to_exception_mapping(exc.status)
+        return exc_type(str(exc))
+
     @staticmethod
     def exception_handler(func: Callable):
         """
@@ -101,23 +138,30 @@ class SBMeraki:
             try:
                 return func(*args, **kwargs)
             except APIKeyError as exc:
-                logger.log(MerakiMessages.APIKEY_NOT_SET_ERROR)
-                raise exceptions.NoAPIKeyError(
-                    MerakiMessages.APIKEY_NOT_SET_ERROR.event
-                ) from exc
+                raise SBMeraki.translate_exception(exc) from exc
+
+            except (APIError, AsyncAPIError) as exc:
+                raise SBMeraki.translate_exception(exc) from None
+
+        inner_function.__name__ = func.__name__
+        inner_function.__module__ = func.__module__
+
+        return inner_function
+
+    @staticmethod
+    def async_exception_handler(func: Callable):
+        """
+        Meraki API Exception Handler for coroutine functions
+        """
+
+        async def inner_function(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except APIKeyError as exc:
+                raise SBMeraki.translate_exception(exc) from exc
 
             except (APIError, AsyncAPIError) as exc:
-                logger.log(
-                    MerakiMessages.MERAKI_UNSUPPORTED_OPERATION
-                    if exc.status == 400
-                    else MerakiMessages.MERAKI_RETURNED_ERROR,
-                    error=str(exc),
-                    message=exc.message,
-                    status=exc.status,
-                    operation=exc.operation,
-                )
-                exc_type = SBMeraki.code_to_exception_mapping(exc.status)
-                raise exc_type(str(exc)) from None
+                raise SBMeraki.translate_exception(exc) from None
 
         inner_function.__name__ = func.__name__
         inner_function.__module__ = func.__module__
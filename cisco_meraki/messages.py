@@ -59,3 +59,15 @@ class MerakiMessages(TMFMessage):
         LogLevel.ERROR,
         "Unable to create meraki client",
     )
+    RATE_LIMITER_UNAVAILABLE = (
+        LogLevel.WARNING,
+        "Meraki rate limiter unavailable. Sending request without a token",
+    )
+    RATE_LIMIT_THROTTLED = (
+        LogLevel.WARNING,
+        "Meraki returned 429. Lowering the organization request rate",
+    )
+    RATE_LIMIT_WAIT_EXCEEDED = (
+        LogLevel.ERROR,
+        "Meraki rate limit budget not available within the maximum wait time",
+    )
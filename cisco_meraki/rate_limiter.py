@@ -0,0 +1,528 @@
+"""
+Distributed rate limiting for the Meraki Dashboard API
+Every worker process shares one token bucket per API key and organization,
+stored in Redis and updated atomically by Lua scripts. Network and device
+requests are charged to the organization registered for them.
+The refill rate of each bucket adapts to the rate limit headers returned
+by the Dashboard API (Retry-After, X-Rate-Limit-Remaining/Reset).
+"""
+
+import asyncio
+import hashlib
+import random
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Final
+
+from meraki import AsyncDashboardAPI, DashboardAPI
+from redis import Redis, RedisError
+
+from common.southbound.cisco_meraki import exceptions
+from common.southbound.cisco_meraki.messages import MerakiMessages
+from common.tools.tmf_logger import TMFLogger
+
+logger = TMFLogger()
+
+DEFAULT_RATE: Final[float] = 10.0
+DEFAULT_MIN_RATE: Final[float] = 1.0
+DEFAULT_CAPACITY: Final[int] = 10
+DEFAULT_MAX_WAIT: Final[float] = 300.0
+DEFAULT_KEY_PREFIX: Final[str] = "meraki:rate-limit"
+DEFAULT_ORGANIZATION: Final[str] = "default"
+DEFAULT_LOW_REMAINING: Final[int] = 2
+DEFAULT_DECREASE_FACTOR: Final[float] = 0.5
+DEFAULT_INCREASE_STEP: Final[float] = 0.5
+DEFAULT_RETRY_AFTER: Final[float] = 1.0
+STATE_TTL_MS: Final[int] = 10 * 60 * 1000
+STATS_TTL_MS: Final[int] = 7 * 24 * 60 * 60 * 1000
+TOO_MANY_REQUESTS: Final[int] = 429
+ORGANIZATION_URL_PATTERN: Final[re.Pattern] = re.compile(r"/organizations/([^/?#]+)")
+NETWORK_URL_PATTERN: Final[re.Pattern] = re.compile(r"/networks/([^/?#]+)")
+DEVICE_URL_PATTERN: Final[re.Pattern] = re.compile(r"/devices/([^/?#]+)")
+# Organization listings whose items are registered to their organization
+ORGANIZATION_LISTING_PATTERN: Final[re.Pattern] = re.compile(
+    r"/organizations/([^/?#]+)/(networks|devices|inventory/devices)/?(?:[?#]|$)"
+)
+
+_organization_scope: ContextVar[str | None] = ContextVar(
+    "meraki_organization_scope", default=None
+)
+
+# KEYS[1]: bucket key
+# KEYS[2]: stats key
+# ARGV[1]: default refill rate (tokens per second)
+# ARGV[2]: bucket capacity
+# ARGV[3]: requested tokens
+# ARGV[4]: bucket state ttl (ms)
+# ARGV[5]: stats ttl (ms)
+# Returns the number of milliseconds to wait, 0 if the tokens were taken
+TOKEN_BUCKET_SCRIPT: Final[str] = """
+if redis.replicate_commands then redis.replicate_commands() end
+local requested = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'rate', 'blocked_until')
+local rate = tonumber(bucket[3]) or tonumber(ARGV[1])
+local capacity = math.max(1, math.min(tonumber(ARGV[2]), math.floor(rate)))
+local blocked_until = tonumber(bucket[4]) or 0
+local wait = 0
+if blocked_until > now then
+    wait = blocked_until - now
+else
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+    if tokens >= requested then
+        tokens = tokens - requested
+    else
+        wait = math.ceil((requested - tokens) * 1000 / rate)
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], ARGV[4])
+end
+if wait > 0 then
+    redis.call('HINCRBY', KEYS[2], 'waits', 1)
+    redis.call('HINCRBY', KEYS[2], 'wait_ms', wait)
+    redis.call('PEXPIRE', KEYS[2], ARGV[5])
+end
+return wait
+"""
+
+# KEYS[1]: bucket key
+# KEYS[2]: stats key
+# ARGV[1]: maximum refill rate
+# ARGV[2]: minimum refill rate
+# ARGV[3]: response status code
+# ARGV[4]: Retry-After (ms), -1 if missing
+# ARGV[5]: X-Rate-Limit-Remaining, -1 if missing
+# ARGV[6]: X-Rate-Limit-Reset (ms from now), -1 if missing
+# ARGV[7]: remaining requests below which the rate is lowered
+# ARGV[8]: multiplicative decrease factor
+# ARGV[9]: additive increase step
+# ARGV[10]: default Retry-After (ms)
+# ARGV[11]: bucket state ttl (ms)
+# ARGV[12]: stats ttl (ms)
+# Returns the pacing event and the new refill rate
+ADAPT_RATE_SCRIPT: Final[str] = """
+if redis.replicate_commands then redis.replicate_commands() end
+local max_rate = tonumber(ARGV[1])
+local min_rate = tonumber(ARGV[2])
+local status = tonumber(ARGV[3])
+local retry_after = tonumber(ARGV[4])
+local remaining = tonumber(ARGV[5])
+local reset = tonumber(ARGV[6])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local rate = tonumber(redis.call('HGET', KEYS[1], 'rate')) or max_rate
+local event = 'steady'
+if status == 429 then
+    rate = math.max(min_rate, rate * tonumber(ARGV[8]))
+    if retry_after < 0 then retry_after = tonumber(ARGV[10]) end
+    redis.call(
+        'HSET', KEYS[1], 'blocked_until', now + retry_after, 'tokens', 0, 'ts', now
+    )
+    event = 'throttled'
+elseif remaining >= 0 and remaining <= tonumber(ARGV[7]) then
+    rate = math.max(min_rate, rate * tonumber(ARGV[8]))
+    if remaining == 0 and reset > 0 then
+        redis.call('HSET', KEYS[1], 'blocked_until', now + reset)
+    end
+    event = 'slowed'
+elseif rate < max_rate then
+    rate = math.min(max_rate, rate + tonumber(ARGV[9]))
+    event = 'accelerated'
+end
+redis.call('HSET', KEYS[1], 'rate', tostring(rate))
+redis.call('PEXPIRE', KEYS[1], ARGV[11])
+redis.call('HINCRBY', KEYS[2], 'responses', 1)
+redis.call('HINCRBY', KEYS[2], event, 1)
+redis.call('PEXPIRE', KEYS[2], ARGV[12])
+return {event, tostring(rate)}
+"""
+
+
+class MerakiRateLimiter:
+    """
+    Redis token bucket limiter keyed by API key and organization id.
+    Callers over budget sleep until a token is available instead of
+    being rejected with a 429 by the Dashboard API.
+
+    The bucket refill rate is paced from every response: a 429 halves it
+    and blocks the bucket for Retry-After, a low X-Rate-Limit-Remaining
+    lowers it, and successful responses raise it back up to `rate`.
+    Pacing counters are kept per bucket and returned by `get_stats`.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        rate: float = DEFAULT_RATE,
+        capacity: int = DEFAULT_CAPACITY,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        min_rate: float = DEFAULT_MIN_RATE,
+        low_remaining: int = DEFAULT_LOW_REMAINING,
+    ):
+        if rate <= 0 or min_rate <= 0 or capacity < 1:
+            raise ValueError("Meraki rate limiter needs a positive rate and capacity")
+
+        self.redis = redis
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.key_prefix = key_prefix
+        self.low_remaining = low_remaining
+        self._token_bucket = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        self._adapt_rate = redis.register_script(ADAPT_RATE_SCRIPT)
+        self._organizations: dict[str, str] = {}
+
+    @staticmethod
+    def organization_from_url(url: str) -> str:
+        """
+        Organization id in the path of a Dashboard API url, the API key
+        default bucket if there is none
+        """
+        if match := ORGANIZATION_URL_PATTERN.search(url):
+            return match.group(1)
+        return DEFAULT_ORGANIZATION
+
+    @staticmethod
+    @contextmanager
+    def organization_scope(organization_id: str) -> Iterator[None]:
+        """
+        Charge the requests made within the block (and the asyncio tasks
+        started from it) to the given organization bucket
+        """
+        token = _organization_scope.set(organization_id)
+        try:
+            yield
+        finally:
+            _organization_scope.reset(token)
+
+    @property
+    def organizations_key(self) -> str:
+        """
+        Redis key of the network and device to organization registry
+        """
+        return f"{self.key_prefix}:organizations"
+
+    def register_organization(
+        self,
+        organization_id: str,
+        network_ids: Iterable[str] = (),
+        serials: Iterable[str] = (),
+    ) -> None:
+        """
+        Register the organization of networks and devices, so their
+        /networks/ and /devices/ requests use the organization bucket
+        """
+        mapping = {
+            **{f"network:{network_id}": organization_id for network_id in network_ids},
+            **{f"device:{serial}": organization_id for serial in serials},
+        }
+        if not mapping:
+            return
+        self._organizations.update(mapping)
+        try:
+            self.redis.hset(self.organizations_key, mapping=mapping)
+        except RedisError:
+            logger.log(MerakiMessages.RATE_LIMITER_UNAVAILABLE, exc_info=True)
+
+    def learn_organizations(self, url: str, items: Any) -> None:
+        """
+        Register the networks and devices listed by an organization endpoint
+        """
+        if not (match := ORGANIZATION_LISTING_PATTERN.search(url)):
+            return
+        if not isinstance(items, list):
+            return
+        organization_id, listing = match.groups()
+        items = [item for item in items if isinstance(item, dict)]
+        if listing == "networks":
+            self.register_organization(
+                organization_id,
+                network_ids=[item["id"] for item in items if "id" in item],
+            )
+        else:
+            self.register_organization(
+                organization_id,
+                network_ids=[
+                    item["networkId"] for item in items if item.get("networkId")
+                ],
+                serials=[item["serial"] for item in items if "serial" in item],
+            )
+
+    def lookup_organization(self, kind: str, resource_id: str) -> str | None:
+        """
+        Registered organization of a network or device, None if unknown
+        """
+        field = f"{kind}:{resource_id}"
+        if (organization_id := self._organizations.get(field)) is not None:
+            return organization_id
+        try:
+            organization_id = self.redis.hget(self.organizations_key, field)
+        except RedisError:
+            logger.log(MerakiMessages.RATE_LIMITER_UNAVAILABLE, exc_info=True)
+            return None
+        if organization_id is None:
+            return None
+        organization_id = self._organizations[field] = _decode(organization_id)
+        return organization_id
+
+    def resolve_organization(self, url: str) -> str:
+        """
+        Organization bucket of a Dashboard API request: the enclosing
+        organization_scope, the organization in the url, or the registered
+        organization of the network or device in the url.
+        Requests for unknown resources share the API key default bucket.
+        """
+        if (organization_id := _organization_scope.get()) is not None:
+            return organization_id
+        if match := ORGANIZATION_URL_PATTERN.search(url):
+            return match.group(1)
+        for kind, pattern in (
+            ("network", NETWORK_URL_PATTERN),
+            ("device", DEVICE_URL_PATTERN),
+        ):
+            if match := pattern.search(url):
+                return (
+                    self.lookup_organization(kind, match.group(1))
+                    or DEFAULT_ORGANIZATION
+                )
+        return DEFAULT_ORGANIZATION
+
+    def bucket_key(self, api_key: str, organization_id: str) -> str:
+        """
+        Redis key of a bucket. The API key is hashed so it is never stored.
+        """
+        api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        return f"{self.key_prefix}:{api_key_hash}:{organization_id}"
+
+    def stats_key(self, api_key: str, organization_id: str) -> str:
+        """
+        Redis key of the pacing counters of a bucket
+        """
+        return self.bucket_key(api_key, organization_id) + ":stats"
+
+    def reserve(self, api_key: str, organization_id: str) -> float:
+        """
+        Try to take a token of the (api key, organization) bucket.
+        Returns the seconds to wait before retrying, 0 if the token was taken.
+        Fails open (returns 0) if Redis is unavailable.
+        """
+        try:
+            wait_ms = int(
+                self._token_bucket(
+                    keys=[
+                        self.bucket_key(api_key, organization_id),
+                        self.stats_key(api_key, organization_id),
+                    ],
+                    args=[self.rate, self.capacity, 1, STATE_TTL_MS, STATS_TTL_MS],
+                )
+            )
+        except RedisError:
+            logger.log(MerakiMessages.RATE_LIMITER_UNAVAILABLE, exc_info=True)
+            return 0
+        if wait_ms <= 0:
+            return 0
+        return wait_ms / 1000 + random.uniform(0, 0.05)
+
+    def wait_exceeded(self, organization_id: str) -> exceptions.TooManyRequestsError:
+        """
+        Log and build the error raised when no token is available within max_wait
+        """
+        logger.log(
+            MerakiMessages.RATE_LIMIT_WAIT_EXCEEDED,
+            organization_id=organization_id,
+            max_wait=self.max_wait,
+        )
+        return exceptions.TooManyRequestsError(
+            MerakiMessages.RATE_LIMIT_WAIT_EXCEEDED.event
+        )
+
+    def acquire(self, api_key: str, organization_id: str = DEFAULT_ORGANIZATION):
+        """
+        Block until a token of the (api key, organization) bucket is taken.
+        Raises:
+            `TooManyRequestsError` if no token is available within max_wait
+        """
+        deadline = time.monotonic() + self.max_wait
+        while wait := self.reserve(api_key, organization_id):
+            if time.monotonic() + wait > deadline:
+                raise self.wait_exceeded(organization_id)
+            time.sleep(wait)
+
+    async def acquire_async(
+        self, api_key: str, organization_id: str = DEFAULT_ORGANIZATION
+    ):
+        """
+        Wait without blocking the event loop until a token of the
+        (api key, organization) bucket is taken.
+        Raises:
+            `TooManyRequestsError` if no token is available within max_wait
+        """
+        deadline = time.monotonic() + self.max_wait
+        while wait := await asyncio.to_thread(self.reserve, api_key, organization_id):
+            if time.monotonic() + wait > deadline:
+                raise self.wait_exceeded(organization_id)
+            await asyncio.sleep(wait)
+
+    def observe(
+        self,
+        api_key: str,
+        organization_id: str,
+        status_code: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """
+        Adapt the bucket refill rate to the rate limit headers of a response
+        """
+        retry_after = _header_seconds(headers, "Retry-After")
+        remaining = _header_int(headers, "X-Rate-Limit-Remaining")
+        reset = _header_seconds(headers, "X-Rate-Limit-Reset")
+        try:
+            event, rate = self._adapt_rate(
+                keys=[
+                    self.bucket_key(api_key, organization_id),
+                    self.stats_key(api_key, organization_id),
+                ],
+                args=[
+                    self.rate,
+                    self.min_rate,
+                    status_code,
+                    -1 if retry_after is None else int(retry_after * 1000),
+                    -1 if remaining is None else remaining,
+                    -1 if reset is None else int(reset * 1000),
+                    self.low_remaining,
+                    DEFAULT_DECREASE_FACTOR,
+                    DEFAULT_INCREASE_STEP,
+                    int(DEFAULT_RETRY_AFTER * 1000),
+                    STATE_TTL_MS,
+                    STATS_TTL_MS,
+                ],
+            )
+        except RedisError:
+            logger.log(MerakiMessages.RATE_LIMITER_UNAVAILABLE, exc_info=True)
+            return
+
+        if status_code == TOO_MANY_REQUESTS:
+            logger.log(
+                MerakiMessages.RATE_LIMIT_THROTTLED,
+                organization_id=organization_id,
+                event=_decode(event),
+                rate=float(_decode(rate)),
+                retry_after=retry_after,
+            )
+
+    def get_stats(
+        self, api_key: str, organization_id: str = DEFAULT_ORGANIZATION
+    ) -> dict[str, int]:
+        """
+        Pacing counters of a bucket:
+        responses, throttled (429), slowed, accelerated, steady, waits, wait_ms
+        """
+        stats = self.redis.hgetall(self.stats_key(api_key, organization_id))
+        return {_decode(name): int(value) for name, value in stats.items()}
+
+    def limit(self, request: Callable, api_key: str) -> Callable:
+        """
+        Wrap a `requests.Session.request` so every HTTP attempt takes a token
+        and every response paces the bucket
+        """
+
+        def limited_request(method, url, *args, **kwargs):
+            organization_id = self.resolve_organization(url)
+            self.acquire(api_key, organization_id)
+            response = request(method, url, *args, **kwargs)
+            self.observe(
+                api_key, organization_id, response.status_code, response.headers
+            )
+            if response.ok and ORGANIZATION_LISTING_PATTERN.search(url):
+                try:
+                    self.learn_organizations(url, response.json())
+                except ValueError:
+                    pass
+            return response
+
+        return limited_request
+
+    def limit_async(self, request: Callable, api_key: str) -> Callable:
+        """
+        Wrap an `aiohttp.ClientSession.request` so every HTTP attempt takes
+        a token and every response paces the bucket
+        """
+
+        async def limited_request(method, url, *args, **kwargs):
+            organization_id = await asyncio.to_thread(
+                self.resolve_organization, str(url)
+            )
+            await self.acquire_async(api_key, organization_id)
+            response = await request(method, url, *args, **kwargs)
+            await asyncio.to_thread(
+                self.observe,
+                api_key,
+                organization_id,
+                response.status,
+                response.headers,
+            )
+            if response.ok and ORGANIZATION_LISTING_PATTERN.search(str(url)):
+                try:
+                    items = await response.json(content_type=None)
+                except ValueError:
+                    items = None
+                self.learn_organizations(str(url), items)
+            return response
+
+        return limited_request
+
+    def install(self, dashboard: DashboardAPI, api_key: str) -> None:
+        """
+        Rate limit every request made by a DashboardAPI, including retries
+        and pagination, by wrapping its underlying HTTP session
+        """
+        # pylint: disable-next=protected-access
+        http_session = dashboard._session._req_session
+        http_session.request = self.limit(http_session.request, api_key)
+
+    def install_async(self, dashboard: AsyncDashboardAPI, api_key: str) -> None:
+        """
+        Rate limit every request made by an AsyncDashboardAPI
+        """
+        # pylint: disable-next=protected-access
+        http_session = dashboard._session._req_session
+        http_session.request = self.limit_async(http_session.request, api_key)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    """
+    Integer value of a response header, None if missing or invalid
+    """
+    try:
+        return int(float(headers[name]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _header_seconds(headers: Mapping[str, str], name: str) -> float | None:
+    """
+    Seconds from now carried by a header holding either a delay in seconds
+    or an epoch timestamp. None if missing or invalid.
+    """
+    try:
+        value = float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if value > time.time() / 2:
+        value -= time.time()
+    return max(0.0, value)
+
+
+def _decode(value: bytes | str) -> str:
+    """
+    Redis replies are bytes unless the client decodes responses
+    """
+    return value.decode("utf-8") if isinstance(value, bytes) else value
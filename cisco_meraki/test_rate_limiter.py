@@ -0,0 +1,71 @@
+"""
+Tests for the Meraki rate limiter organization buckets
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from common.southbound.cisco_meraki.rate_limiter import (
+    DEFAULT_ORGANIZATION,
+    MerakiRateLimiter,
+)
+
+
+@pytest.fixture(name="rate_limiter")
+def fixture_rate_limiter(mocker: MockerFixture) -> MerakiRateLimiter:
+    """
+    Rate limiter on a dict backed redis mock, never waiting for a token
+    """
+    registry: dict[str, str] = {}
+    redis = MagicMock()
+    redis.hset.side_effect = lambda _, mapping: registry.update(mapping)
+    redis.hget.side_effect = lambda _, field: registry.get(field)
+    rate_limiter = MerakiRateLimiter(redis)
+    mocker.patch.object(rate_limiter, "acquire")
+    mocker.patch.object(rate_limiter, "observe")
+    return rate_limiter
+
+
+def test_network_requests_use_organization_bucket(rate_limiter: MerakiRateLimiter):
+    """
+    Test if /networks/ and /devices/ requests are charged to the organization
+    listing them
+    """
+    responses = {
+        "/api/v1/organizations/123/networks": [{"id": "N_1"}],
+        "/api/v1/organizations/123/devices": [{"serial": "Q2XX", "networkId": "N_2"}],
+    }
+
+    def request(_, url, *__, **___):
+        response = MagicMock(ok=True, status_code=200, headers={})
+        response.json.return_value = responses.get(url, [])
+        return response
+
+    limited_request = rate_limiter.limit(request, "api-key")
+    assert rate_limiter.resolve_organization("/api/v1/networks/N_1") == (
+        DEFAULT_ORGANIZATION
+    )
+
+    limited_request("GET", "/api/v1/organizations/123/networks")
+    limited_request("GET", "/api/v1/organizations/123/devices")
+    limited_request("GET", "/api/v1/networks/N_1/devices")
+
+    rate_limiter.acquire.assert_called_with("api-key", "123")
+    assert rate_limiter.resolve_organization("/api/v1/networks/N_2") == "123"
+    assert rate_limiter.resolve_organization("/api/v1/devices/Q2XX/lldpCdp") == "123"
+    assert rate_limiter.resolve_organization("/api/v1/networks/N_3") == (
+        DEFAULT_ORGANIZATION
+    )
+
+
+def test_organization_scope(rate_limiter: MerakiRateLimiter):
+    """
+    Test if an explicit organization scope overrides the url
+    """
+    with MerakiRateLimiter.organization_scope("456"):
+        assert rate_limiter.resolve_organization("/api/v1/networks/N_3") == "456"
+    assert rate_limiter.resolve_organization("/api/v1/networks/N_3") == (
+        DEFAULT_ORGANIZATION
+    )
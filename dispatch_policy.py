@@ -0,0 +1,418 @@
+"""
+Scheduler dispatch policies, choosing which pending job of a vendor runs next
+"""
+
+import json
+import time
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Final, NamedTuple, Protocol
+
+from pydantic import Extra
+from redis.commands.core import Script
+
+from common.tools import TMFLogger
+
+from .execution_slots import (
+    DEFAULT_START_TIMEOUT,
+    EXECUTION_SLOT_JOBS_KEY,
+    EXECUTION_SLOTS_KEY,
+)
+from .pending_index import (
+    PENDING_JOB_NAMES_KEY,
+    PENDING_VENDOR_JOB_NAMES_KEY,
+    RECEIVE_TIME_FUNCTION,
+    PendingJobIndex,
+    local_utc_offset,
+)
+from .redis.util import PENDING_JOBS_KEY, PendingJob
+from .settings import DEFAULT_AGING_INTERVAL, get_dispatch_settings, get_redis
+
+DISPATCH_CREDITS_KEY: Final[str] = "inventory-agent:dispatch:credits"
+WAIT_COUNT_KEY: Final[str] = "inventory-agent:dispatch:wait-count"
+WAIT_TOTAL_KEY: Final[str] = "inventory-agent:dispatch:wait-total"
+WAIT_MAX_KEY: Final[str] = "inventory-agent:dispatch:wait-max"
+DROPPED_JOBS_KEY: Final[str] = "inventory-agent:dispatch:dropped"
+logger = TMFLogger()
+
+
+# Frees the expired execution slots of the vendor, putting the jobs which were
+# never marked as started back at the head of the pending queue (unless a job
+# with the same name was enqueued since, then the job is dropped, counted and
+# returned to be logged). Then checks the broker queue and the
+# vendor execution slots, picks the next pending job of the vendor which has a
+# free slot (first one, or by smooth weighted round robin when task weights are
+# given), removes it from the pending queue and its name indexes, holds its
+# slot for the start timeout with the job stored in it and records its wait
+# time, all in one atomic step.
+# Slots are numbered 1 to capacity, or keyed by the job task name when
+# sharded. Wait times are measured from the job receive date.
+DISPATCH_SCRIPT: Final[str] = RECEIVE_TIME_FUNCTION + """
+local vendor = ARGV[1]
+local now = tonumber(ARGV[4])
+local utc_offset = tonumber(ARGV[10])
+local capacity = tonumber(ARGV[7])
+local dropped = {}
+local expired = redis.call("ZRANGEBYSCORE", KEYS[4], "-inf", now)
+for _, slot in ipairs(expired) do
+    local raw_job = redis.call("HGET", KEYS[9], slot)
+    local job = raw_job and cjson.decode(raw_job)
+    if job and not job.started then
+        if redis.call("ZADD", KEYS[2], "NX", now, job.name) == 0 then
+            table.insert(dropped, raw_job)
+            redis.call("HINCRBY", KEYS[11], vendor .. ":" .. job.name, 1)
+        else
+            job.slot = nil
+            job.job_id = nil
+            redis.call("LPUSH", KEYS[1], cjson.encode(job))
+            redis.call(
+                "ZADD",
+                KEYS[10],
+                receive_time(job.jobReceiveDate, utc_offset) or now,
+                job.name
+            )
+        end
+    end
+end
+if #expired > 0 then
+    redis.call("ZREM", KEYS[4], unpack(expired))
+    redis.call("HDEL", KEYS[9], unpack(expired))
+end
+local held = redis.call("ZCARD", KEYS[4])
+if held >= capacity or redis.call("LLEN", KEYS[5]) >= tonumber(ARGV[2]) then
+    return {false, "0", math.max(capacity - held, 0), unpack(dropped)}
+end
+
+local free_slot = nil
+if ARGV[8] == "" then
+    for slot = 1, capacity do
+        if not redis.call("ZSCORE", KEYS[4], tostring(slot)) then
+            free_slot = tostring(slot)
+            break
+        end
+    end
+end
+
+local jobs = {}
+for _, raw_job in ipairs(redis.call("LRANGE", KEYS[1], 0, -1)) do
+    local job = cjson.decode(raw_job)
+    if job.job_queue == vendor then
+        local slot = free_slot or job.name
+        if not redis.call("ZSCORE", KEYS[4], slot) then
+            local received = receive_time(job.jobReceiveDate, utc_offset) or now
+            table.insert(jobs, {
+                raw = raw_job,
+                data = job,
+                slot = slot,
+                field = vendor .. ":" .. job.name,
+                wait = math.max(now - received, 0),
+            })
+        end
+    end
+end
+if #jobs == 0 then
+    return {false, "0", capacity - held, unpack(dropped)}
+end
+
+local selected = 1
+if ARGV[6] ~= "" then
+    local task_weights = cjson.decode(ARGV[6])
+    local aging_interval = tonumber(ARGV[5])
+    local total = 0
+    for index, job in ipairs(jobs) do
+        local weight = (task_weights[job.data.name] or 1)
+            * (1 + job.wait / aging_interval)
+        job.credit = (tonumber(redis.call("HGET", KEYS[3], job.field)) or 0) + weight
+        total = total + weight
+        if job.credit > jobs[selected].credit then
+            selected = index
+        end
+    end
+    jobs[selected].credit = jobs[selected].credit - total
+    for _, job in ipairs(jobs) do
+        redis.call("HSET", KEYS[3], job.field, tostring(job.credit))
+    end
+end
+
+local job = jobs[selected]
+job.data.slot = job.slot
+job.data.job_id = ARGV[9]
+local dispatched = cjson.encode(job.data)
+redis.call("LREM", KEYS[1], 1, job.raw)
+redis.call("ZREM", KEYS[2], job.data.name)
+redis.call("ZREM", KEYS[10], job.data.name)
+redis.call("ZADD", KEYS[4], now + tonumber(ARGV[3]), job.slot)
+redis.call("HSET", KEYS[9], job.slot, dispatched)
+redis.call("HINCRBY", KEYS[6], job.field, 1)
+redis.call("HINCRBYFLOAT", KEYS[7], job.field, tostring(job.wait))
+redis.call("ZADD", KEYS[8], "GT", tostring(job.wait), job.field)
+return {dispatched, tostring(job.wait), capacity - held - 1, unpack(dropped)}
+"""
+
+
+class DispatchedJob(PendingJob):
+    """
+    Pending job removed from the queue by the dispatch script, with the
+    execution slot it holds and its celery task id.
+    Unknown attributes are kept as they were stored.
+    """
+
+    slot: str
+    job_id: str
+
+    class Config:
+        extra = Extra.allow
+
+
+class Dispatch(NamedTuple):
+    """
+    Job to start, the seconds it waited in the pending queue
+    and the execution slots the vendor has left
+    """
+
+    job: DispatchedJob
+    wait_time: float
+    free_slots: int
+
+
+class DispatchPolicy(Protocol):
+    """
+    Dispatch Policy Interface
+    """
+
+    def order_vendors(self, vendors: Sequence[str]) -> Sequence[str]:
+        """
+        Order in which the ready vendors are dispatched on a scheduler tick
+        """
+
+    def pop(self, vendor: str, max_queue_length: int, job_id: str) -> Dispatch | None:
+        """
+        Atomically take the next job of the vendor, to be started with the
+        celery task id `job_id`, if it has a free execution slot and its
+        broker queue is shorter than `max_queue_length`
+        """
+
+
+class BaseDispatchPolicy:
+    """
+    Execution slots configuration shared by the dispatch policies.
+    Vendors have `vendor_slots` slots (1 by default), when `shard_slots` is set
+    each task holds its own slot so the same task never runs twice at once.
+    """
+
+    def __init__(
+        self,
+        vendor_slots: dict[str, int] | None = None,
+        shard_slots: bool = False,
+    ):
+        self.vendor_slots = vendor_slots or {}
+        self.shard_slots = shard_slots
+
+    def slots(self, vendor: str) -> int:
+        """
+        Number of execution slots of the vendor
+        """
+        return self.vendor_slots.get(vendor, 1)
+
+
+class FifoDispatchPolicy(BaseDispatchPolicy):
+    """
+    Vendors in configuration order, the oldest pending job of a vendor first
+    """
+
+    def order_vendors(self, vendors: Sequence[str]) -> Sequence[str]:
+        return vendors
+
+    def pop(self, vendor: str, max_queue_length: int, job_id: str) -> Dispatch | None:
+        return dispatch_next_job(
+            vendor,
+            max_queue_length,
+            job_id,
+            slots=self.slots(vendor),
+            shard_slots=self.shard_slots,
+        )
+
+
+class WeightedFairSharePolicy(BaseDispatchPolicy):
+    """
+    Smooth weighted round robin across the task types pending for a vendor,
+    with aging: a job's weight grows by its base weight every `aging_interval`
+    seconds it waits, so low weight jobs can not starve.
+    Vendors are dispatched by decreasing age of their oldest job.
+    The round robin credits are kept in redis so they survive across ticks
+    and workers.
+    """
+
+    def __init__(
+        self,
+        task_weights: dict[str, float] | None = None,
+        aging_interval: float = DEFAULT_AGING_INTERVAL,
+        vendor_slots: dict[str, int] | None = None,
+        shard_slots: bool = False,
+    ):
+        super().__init__(vendor_slots, shard_slots)
+        self.task_weights = task_weights or {}
+        self.aging_interval = aging_interval
+
+    def order_vendors(self, vendors: Sequence[str]) -> Sequence[str]:
+        oldest_jobs = PendingJobIndex.oldest_receive_times(vendors)
+        return sorted(vendors, key=oldest_jobs.__getitem__)
+
+    def pop(self, vendor: str, max_queue_length: int, job_id: str) -> Dispatch | None:
+        return dispatch_next_job(
+            vendor,
+            max_queue_length,
+            job_id,
+            slots=self.slots(vendor),
+            shard_slots=self.shard_slots,
+            task_weights=self.task_weights,
+            aging_interval=self.aging_interval,
+        )
+
+
+@lru_cache
+def get_dispatch_policy() -> DispatchPolicy:
+    """
+    Get the configured dispatch policy
+    """
+    settings = get_dispatch_settings()
+    match settings.policy:
+        case "fifo":
+            return FifoDispatchPolicy(
+                vendor_slots=settings.vendor_slots,
+                shard_slots=settings.shard_slots,
+            )
+        case "fair_share":
+            return WeightedFairSharePolicy(
+                task_weights=settings.task_weights,
+                aging_interval=settings.aging_interval,
+                vendor_slots=settings.vendor_slots,
+                shard_slots=settings.shard_slots,
+            )
+
+
+@lru_cache
+def get_dispatch_script() -> Script:
+    """
+    Get the dispatch script, loaded once and then called by its SHA
+    """
+    return get_redis().register_script(DISPATCH_SCRIPT)
+
+
+def dispatch_next_job(
+    vendor: str,
+    max_queue_length: int,
+    job_id: str,
+    slots: int = 1,
+    shard_slots: bool = False,
+    task_weights: dict[str, float] | None = None,
+    aging_interval: float = DEFAULT_AGING_INTERVAL,
+) -> Dispatch | None:
+    """
+    Run the dispatch script for a vendor, in a single round trip.
+    Without task weights the first pending job of the vendor is taken.
+    """
+    result = get_dispatch_script()(
+        keys=[
+            PENDING_JOBS_KEY,
+            PENDING_JOB_NAMES_KEY,
+            DISPATCH_CREDITS_KEY,
+            EXECUTION_SLOTS_KEY.format(vendor=vendor),
+            vendor,
+            WAIT_COUNT_KEY,
+            WAIT_TOTAL_KEY,
+            WAIT_MAX_KEY,
+            EXECUTION_SLOT_JOBS_KEY.format(vendor=vendor),
+            PENDING_VENDOR_JOB_NAMES_KEY.format(vendor=vendor),
+            DROPPED_JOBS_KEY,
+        ],
+        args=[
+            vendor,
+            max_queue_length,
+            DEFAULT_START_TIMEOUT,
+            time.time(),
+            aging_interval,
+            json.dumps(task_weights) if task_weights is not None else "",
+            slots,
+            "1" if shard_slots else "",
+            job_id,
+            local_utc_offset(),
+        ],
+    )
+    raw_job, wait_time, free_slots, *dropped = result
+    for raw_dropped in dropped:
+        dropped_job = json.loads(raw_dropped)
+        logger.warning(
+            "Dispatched job never started dropped, a job with the same name is pending",
+            task_name=dropped_job.get("name"),
+            task_queue=vendor,
+            task_id=dropped_job.get("job_id"),
+        )
+    if raw_job is None:
+        return None
+    return Dispatch(DispatchedJob.parse_raw(raw_job), float(wait_time), int(free_slots))
+
+
+def get_dropped_jobs() -> dict[str, int]:
+    """
+    Number of dispatched jobs dropped because they were never started while
+    a job with the same name was pending, keyed by `<vendor>:<task name>`
+    """
+    return {
+        field.decode(): int(count)
+        for field, count in get_redis().hgetall(DROPPED_JOBS_KEY).items()
+    }
+
+
+class WaitStats(NamedTuple):
+    """
+    Time pending jobs waited before being dispatched
+    """
+
+    count: int
+    mean: float
+    max: float
+
+
+class DispatchWaitStats:
+    """
+    Wait time statistics per vendor and task, to measure dispatch fairness
+    """
+
+    @staticmethod
+    def get_all() -> dict[str, WaitStats]:
+        """
+        Wait time statistics keyed by `<vendor>:<task name>`
+        """
+        pipeline = get_redis().pipeline()
+        pipeline.hgetall(WAIT_COUNT_KEY)
+        pipeline.hgetall(WAIT_TOTAL_KEY)
+        pipeline.zrange(WAIT_MAX_KEY, 0, -1, withscores=True)
+        counts, totals, maxes = pipeline.execute()
+        maxes = dict(maxes)
+        return {
+            field.decode(): WaitStats(
+                count=int(count),
+                mean=float(totals.get(field, 0)) / int(count),
+                max=maxes.get(field, 0.0),
+            )
+            for field, count in counts.items()
+        }
+
+    @staticmethod
+    def by_vendor() -> dict[str, WaitStats]:
+        """
+        Wait time statistics aggregated per vendor
+        """
+        stats: dict[str, WaitStats] = {}
+        for field, task_stats in DispatchWaitStats.get_all().items():
+            vendor = field.split(":", 1)[0]
+            current = stats.get(vendor, WaitStats(0, 0.0, 0.0))
+            count = current.count + task_stats.count
+            stats[vendor] = WaitStats(
+                count=count,
+                mean=(current.mean * current.count + task_stats.mean * task_stats.count)
+                / count,
+                max=max(current.max, task_stats.max),
+            )
+        return stats
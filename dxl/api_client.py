@@ -2,10 +2,13 @@
 APIClient
 """
 
+import asyncio
 import json
+import ssl
+import threading
 import uuid
-from datetime import datetime, timedelta
-from tempfile import NamedTemporaryFile
+from collections.abc import Iterator
+from typing import Any
 
 import httpx
 from httpx import (
@@ -21,8 +24,19 @@ from pydantic import AnyHttpUrl
 from structlog import get_logger
 
 from . import models
+from .circuit_breaker import (
+    AsyncCircuitBreakerTransport,
+    CircuitBreakerTransport,
+    get_circuit_breaker,
+)
+from .json_stream import iter_json_array
+from .ssl_context import get_ssl_context
+from .token_cache import TOKEN_CACHE, TokenKey
 
 DEFAULT_TIMEOUT: float = 30.0
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
 
 
 def handle_request_errors(api_calling_func):
@@ -55,43 +69,138 @@ class APIClient:
         auth: models.AuthConfig | None = None,
         dxl: models.DXLConfig | None = None,
         retries: int = 3,
+        timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ):
+        """
+        The sync and async httpx clients are created on first use and kept
+        alive until close()/aclose(), so consecutive requests reuse pooled
+        connections. `http2=True` requires the optional `h2` package.
+        Requests to `endpoint` go through its process-wide circuit breaker.
+        """
         self.endpoint = endpoint
         self.mutual_ssl = mutual_ssl
-        self.mutual_ssl_config = self.generate_cert_files()
+        self.ssl_context = get_ssl_context(mutual_ssl) if mutual_ssl else None
         self.auth = auth
         self.dxl = dxl
+        self.retries = retries
+        self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
         self.token_data: models.TokenResponse | None = None
         self.log = get_logger()
-        self.base_transport = HTTPTransport(
-            retries=retries, cert=self.mutual_ssl_config
-        )
-        self.async_transport = AsyncHTTPTransport(
-            retries=retries, cert=self.mutual_ssl_config
+        self.circuit_breaker = get_circuit_breaker(str(endpoint)) if endpoint else None
+        self.base_transport = self.build_transport()
+        self.async_transport = self.build_async_transport()
+        self._client: Client | None = None
+        self._client_lock = threading.Lock()
+        self._async_client: AsyncClient | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def verify(self) -> ssl.SSLContext | bool:
+        """
+        SSL verification for the transports, the shared mutual TLS
+        context when a client certificate is configured
+        """
+        return self.ssl_context if self.ssl_context is not None else True
+
+    def build_transport(self) -> httpx.BaseTransport:
+        """
+        Pooled HTTP transport, guarded by the endpoint circuit breaker
+        """
+        transport = HTTPTransport(
+            verify=self.verify,
+            retries=self.retries,
+            limits=self.limits,
+            http2=self.http2,
         )
+        if self.circuit_breaker is None:
+            return transport
+        return CircuitBreakerTransport(transport, self.circuit_breaker)
 
-    def generate_cert_files(self):
+    def build_async_transport(self) -> httpx.AsyncBaseTransport:
         """
-        httpx library requires certificates to be files
-        To be able to store certs as secrets this load strings and convert to files
+        Pooled async HTTP transport, guarded by the endpoint circuit breaker
         """
-        if self.mutual_ssl is not None:
-            with (
-                NamedTemporaryFile(mode="w+b", delete=False) as cert_file,
-                NamedTemporaryFile(mode="w+b", delete=False) as private_key_file,
-            ):
-                cert_file.write(self.mutual_ssl.cert_public.encode("utf-8"))
-                cert_file.seek(0)
+        transport = AsyncHTTPTransport(
+            verify=self.verify,
+            retries=self.retries,
+            limits=self.limits,
+            http2=self.http2,
+        )
+        if self.circuit_breaker is None:
+            return transport
+        return AsyncCircuitBreakerTransport(transport, self.circuit_breaker)
+
+    def __enter__(self):
+        """Use the client as a context manager"""
+        return self
 
-                private_key_file.write(self.mutual_ssl.cert_private.encode("utf-8"))
-                private_key_file.seek(0)
+    def __exit__(self, *_):
+        """Release pooled connections on exit"""
+        self.close()
 
-                return (
-                    f"{ cert_file.name }",
-                    f"{ private_key_file.name }",
-                    self.mutual_ssl.cert_passphrase,
+    async def __aenter__(self):
+        """Use the client as an async context manager"""
+        return self
+
+    async def __aexit__(self, *_):
+        """Release pooled connections on exit"""
+        await self.aclose()
+
+    @property
+    def client(self) -> Client:
+        """
+        Persistent pooled HTTP client, (re)created lazily after close()
+        """
+        with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = Client(
+                    transport=self.base_transport, timeout=self.timeout
                 )
-        return None
+            return self._client
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """
+        Persistent pooled async HTTP client, (re)created lazily after aclose().
+        Pooled connections belong to the event loop that opened them, so a new
+        client is created when called from a different running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_client is None
+            or self._async_client.is_closed
+            or self._async_client_loop is not loop
+        ):
+            if self._async_client is not None:
+                self.async_transport = self.build_async_transport()
+            self._async_client = AsyncClient(
+                transport=self.async_transport, timeout=self.timeout
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def close(self) -> None:
+        """
+        Close the pooled sync HTTP client and release its connections
+        """
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled async HTTP client and release its connections
+        """
+        if self._async_client is not None:
+            if self._async_client_loop is asyncio.get_running_loop():
+                await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
 
     def request_headers(self, transaction_id):
         """
@@ -120,19 +229,35 @@ class APIClient:
 
     def check_token(self):
         """
-        Check if the token is valid and if not renew it
+        Check if the token is valid and not due for an early refresh
         """
         if self.token_data is None:
             return False
-        issued_at = datetime.utcfromtimestamp(int(self.token_data.issued_at) / 1000)
-        expires_in_delta = timedelta(seconds=int(self.token_data.expires_in))
-        token_valid = datetime.utcnow() < issued_at + expires_in_delta
 
-        if token_valid is True:
-            self.log.info("Token is is still valid", issued_at=issued_at)
+        if TOKEN_CACHE.is_fresh(self.token_data):
+            self.log.info(
+                "Token is is still valid", issued_at=self.token_data.issued_at
+            )
             return True
         return False
 
+    @property
+    def token_key(self) -> TokenKey | None:
+        """
+        Key of the OAuth token in the process-wide token cache
+        """
+        if (
+            self.auth is None
+            or self.auth.type.value != models.AuthTypes.OAUTH
+            or self.auth.oauth is None
+        ):
+            return None
+        return TokenKey(
+            token_endpoint=self.auth.oauth.token_endpoint,
+            client_id=self.auth.oauth.client_id,
+            scope=self.auth.oauth.scope,
+        )
+
     def get_auth(self) -> AuthTypes | UseClientDefault:
         """
         Get Auth data for API calls
@@ -145,53 +270,128 @@ class APIClient:
     def authenticate_endpoint(self):
         """
         Authenticate against DXL
+        Tokens are shared with every APIClient using the same token endpoint,
+        client id and scope.
+        """
+        if (token_key := self.token_key) is not None:
+            if self.check_token():
+                return
+            self.token_data = TOKEN_CACHE.get_or_fetch(token_key, self.request_token)
+            return
+        self.log.debug("Not Using Authentication")
+
+    def request_token(self) -> models.TokenResponse:
         """
+        Request a new OAuth token using the client credentials grant
+        """
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        data = models.AuthBody(
+            client_id=self.auth.oauth.client_id,
+            client_secret=self.auth.oauth.client_secret,
+            scope=self.auth.oauth.scope,
+            grant_type="client_credentials",
+        ).dict()
 
-        if (
-            self.auth is not None
-            and self.auth.type.value == models.AuthTypes.OAUTH
-            and self.auth.oauth is not None
-        ):
+        response = self.client.post(
+            url=self.auth.oauth.token_endpoint,
+            headers=headers,
+            data=data,
+        )
+        try:
+            response.raise_for_status()
+        except HTTPStatusError as http_error:
+            self.error_handler(response, http_error)
+        return models.TokenResponse(**response.json())
+
+    async def async_authenticate_endpoint(self):
+        """
+        Authenticate against DXL without blocking the event loop
+        Only one task of the loop requests a token, the others await it.
+        """
+        if (token_key := self.token_key) is not None:
             if self.check_token():
                 return
-            headers = {"Content-Type": "application/x-www-form-urlencoded"}
-            data = models.AuthBody(
-                client_id=self.auth.oauth.client_id,
-                client_secret=self.auth.oauth.client_secret,
-                scope=self.auth.oauth.scope,
-                grant_type="client_credentials",
-            ).dict()
-
-            response = httpx.post(
+            self.token_data = await TOKEN_CACHE.async_get_or_fetch(
+                token_key, self.async_request_token
+            )
+            return
+        self.log.debug("Not Using Authentication")
+
+    async def async_request_token(self) -> models.TokenResponse:
+        """
+        Request a new OAuth token using the client credentials grant
+        """
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        data = models.AuthBody(
+            client_id=self.auth.oauth.client_id,
+            client_secret=self.auth.oauth.client_secret,
+            scope=self.auth.oauth.scope,
+            grant_type="client_credentials",
+        ).dict()
+
+        try:
+            response = await self.async_client.post(
                 url=self.auth.oauth.token_endpoint,
                 headers=headers,
-                cert=self.mutual_ssl_config,
                 data=data,
             )
-            try:
-                response.raise_for_status()
-                self.token_data = models.TokenResponse(**response.json())
-            except HTTPStatusError as http_error:
-                self.error_handler(response, http_error)
-        self.log.debug("Not Using Authentication")
+            response.raise_for_status()
+        except HTTPStatusError as http_error:
+            self.error_handler(http_error.response, http_error)
+        except httpx.HTTPError:
+            self.log.error("Error Making Request", exc_info=True)
+            raise
+        return models.TokenResponse(**response.json())
 
     @handle_request_errors
-    def request_get(self, resource):
+    def request_get(self, resource, headers: dict[str, str] | None = None):
         """
         Make a GET request
+        Extra `headers` are sent along the authentication headers, a
+        304 Not Modified answer to a conditional request is returned as is.
         """
         if not self.check_token():
             self.authenticate_endpoint()
-        headers = self.request_headers(transaction_id=str(uuid.uuid4()))
+        request_headers = self.request_headers(transaction_id=str(uuid.uuid4()))
+        if headers is not None:
+            request_headers.update(headers)
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        with Client(transport=self.base_transport, timeout=DEFAULT_TIMEOUT) as client:
-            response = client.get(
-                request_url, headers=headers, auth=auth_data, follow_redirects=True
-            )
-        response.raise_for_status()
+        response = self.client.get(
+            request_url, headers=request_headers, auth=auth_data, follow_redirects=True
+        )
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
         return response
 
+    def request_get_items(self, resource) -> Iterator[Any]:
+        """
+        Make a streamed GET request and yield the elements of the top level
+        JSON array of the response one at a time, so the whole payload is never
+        held in memory
+        """
+        if not self.check_token():
+            self.authenticate_endpoint()
+        headers = self.request_headers(transaction_id=str(uuid.uuid4()))
+        request_url = self.endpoint + resource
+        auth_data = self.get_auth()
+        try:
+            with self.client.stream(
+                "GET",
+                request_url,
+                headers=headers,
+                auth=auth_data,
+                follow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+                yield from iter_json_array(response.iter_text())
+        except json.decoder.JSONDecodeError:
+            self.log.error("Error Parsing Response Data as JSON", exc_info=True)
+            raise
+        except httpx.HTTPError:
+            self.log.error("Error Making Request", exc_info=True)
+            raise
+
     @handle_request_errors
     def request_post(self, resource, data):
         """
@@ -202,30 +402,33 @@ class APIClient:
         headers = self.request_headers(transaction_id=str(uuid.uuid4()))
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        with Client(transport=self.base_transport, timeout=DEFAULT_TIMEOUT) as client:
-            response = client.post(
-                url=request_url,
-                headers=headers,
-                auth=auth_data,
-                json=data,
-            )
+        response = self.client.post(
+            url=request_url,
+            headers=headers,
+            auth=auth_data,
+            json=data,
+        )
         response.raise_for_status()
         return response
 
-    async def async_request_get(self, resource):
+    async def async_request_get(self, resource, headers: dict[str, str] | None = None):
         """
         Make a async GET request
+        Extra `headers` are sent along the authentication headers, a
+        304 Not Modified answer to a conditional request is returned as is.
         """
         if not self.check_token():
-            self.authenticate_endpoint()
-        headers = self.request_headers(transaction_id=str(uuid.uuid4()))
+            await self.async_authenticate_endpoint()
+        request_headers = self.request_headers(transaction_id=str(uuid.uuid4()))
+        if headers is not None:
+            request_headers.update(headers)
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        async with AsyncClient(
-            transport=self.async_transport, timeout=DEFAULT_TIMEOUT
-        ) as client:
-            response = await client.get(request_url, headers=headers, auth=auth_data)
-        response.raise_for_status()
+        response = await self.async_client.get(
+            request_url, headers=request_headers, auth=auth_data
+        )
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
         return response
 
     async def async_request_post(self, resource, data):
@@ -233,20 +436,17 @@ class APIClient:
         Make a async POST Request
         """
         if not self.check_token():
-            self.authenticate_endpoint()
+            await self.async_authenticate_endpoint()
         transaction_id = str(uuid.uuid4())
         headers = self.request_headers(transaction_id=transaction_id)
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        async with AsyncClient(
-            transport=self.async_transport, timeout=DEFAULT_TIMEOUT
-        ) as client:
-            response = await client.post(
-                url=request_url,
-                auth=auth_data,
-                headers=headers,
-                json=data,
-            )
+        response = await self.async_client.post(
+            url=request_url,
+            auth=auth_data,
+            headers=headers,
+            json=data,
+        )
         response.raise_for_status()
         self.log.info(
             "Sent Message to next component.",
@@ -262,20 +462,17 @@ class APIClient:
         Make a async PATCH Request
         """
         if not self.check_token():
-            self.authenticate_endpoint()
+            await self.async_authenticate_endpoint()
         transaction_id = str(uuid.uuid4())
         headers = self.request_headers(transaction_id=transaction_id)
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        async with AsyncClient(
-            transport=self.async_transport, timeout=DEFAULT_TIMEOUT
-        ) as client:
-            response = await client.patch(
-                url=request_url,
-                auth=auth_data,
-                headers=headers,
-                json=data,
-            )
+        response = await self.async_client.patch(
+            url=request_url,
+            auth=auth_data,
+            headers=headers,
+            json=data,
+        )
         response.raise_for_status()
         self.log.info(
             "Sent Message to next component.",
@@ -296,12 +493,11 @@ class APIClient:
         headers = self.request_headers(transaction_id=str(uuid.uuid4()))
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        with Client(transport=self.base_transport, timeout=DEFAULT_TIMEOUT) as client:
-            response = client.delete(
-                url=request_url,
-                headers=headers,
-                auth=auth_data,
-            )
+        response = self.client.delete(
+            url=request_url,
+            headers=headers,
+            auth=auth_data,
+        )
         response.raise_for_status()
         return response
 
@@ -315,13 +511,12 @@ class APIClient:
         headers = self.request_headers(transaction_id=str(uuid.uuid4()))
         request_url = self.endpoint + resource
         auth_data = self.get_auth()
-        with Client(transport=self.base_transport, timeout=DEFAULT_TIMEOUT) as client:
-            response = client.patch(
-                url=request_url,
-                headers=headers,
-                auth=auth_data,
-                json=data,
-            )
+        response = self.client.patch(
+            url=request_url,
+            headers=headers,
+            auth=auth_data,
+            json=data,
+        )
         response.raise_for_status()
         return response
 
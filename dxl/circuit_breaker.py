@@ -0,0 +1,334 @@
+"""
+Per endpoint circuit breaker for the internal TMF APIs
+"""
+
+import threading
+import time
+from enum import Enum
+from functools import cache
+from typing import Final
+
+import httpx
+
+LIVENESS_PATH: Final[str] = "/system/liveness"
+LIVENESS_TIMEOUT = httpx.Timeout(2.0)
+DEFAULT_FAILURE_THRESHOLD: Final[int] = 5
+DEFAULT_RECOVERY_TIMEOUT: Final[float] = 30.0
+DEFAULT_LIVENESS_TTL: Final[float] = 5.0
+
+
+class CircuitState(str, Enum):
+    """
+    Circuit Breaker States
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.RequestError):
+    """
+    Request rejected without being sent because the endpoint is considered down
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the requests sent to one endpoint.
+    The circuit opens after `failure_threshold` consecutive failures (connection
+    errors, timeouts and 5xx responses), or on the first one when the endpoint
+    liveness check fails. While open, requests fail fast with CircuitOpenError.
+    After `recovery_timeout` seconds a single trial request is let through
+    (half-open) if the liveness check passes, its outcome closes or reopens
+    the circuit. Liveness results are cached for `liveness_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        liveness_ttl: float = DEFAULT_LIVENESS_TTL,
+    ):
+        self.endpoint = endpoint.rstrip("/")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.liveness_ttl = liveness_ttl
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._liveness: tuple[bool, float] | None = None
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Override string representation"""
+        return f"CircuitBreaker(endpoint={self.endpoint}, state={self.state.value})"
+
+    @property
+    def liveness_url(self) -> str:
+        """
+        URL of the endpoint liveness check
+        """
+        return self.endpoint + LIVENESS_PATH
+
+    def handles(self, request: httpx.Request) -> bool:
+        """
+        Check if the request is sent to the endpoint guarded by this breaker
+        """
+        return str(request.url).startswith(self.endpoint)
+
+    def cached_liveness(self) -> bool | None:
+        """
+        Result of the last liveness check if it is still fresh
+        """
+        if self._liveness is None:
+            return None
+        alive, checked_at = self._liveness
+        return alive if time.monotonic() < checked_at + self.liveness_ttl else None
+
+    def set_liveness(self, alive: bool) -> None:
+        """
+        Cache the result of a liveness check
+        """
+        self._liveness = (alive, time.monotonic())
+
+    def needs_liveness_check(self) -> bool:
+        """
+        Check if an open circuit is due for recovery without a fresh liveness result
+        """
+        return (
+            self.state == CircuitState.OPEN
+            and time.monotonic() >= self.opened_at + self.recovery_timeout
+            and self.cached_liveness() is None
+        )
+
+    def before_request(self, request: httpx.Request) -> None:
+        """
+        Let the request through or raise CircuitOpenError
+        """
+        with self._lock:
+            match self.state:
+                case CircuitState.CLOSED:
+                    return
+                case CircuitState.OPEN:
+                    now = time.monotonic()
+                    if now < self.opened_at + self.recovery_timeout:
+                        raise CircuitOpenError(
+                            f"{self} rejected request", request=request
+                        )
+                    if not self.cached_liveness():
+                        self.opened_at = now
+                        raise CircuitOpenError(
+                            f"{self} liveness check failed", request=request
+                        )
+                    self.state = CircuitState.HALF_OPEN
+                    self._trial_in_flight = True
+                case CircuitState.HALF_OPEN:
+                    if self._trial_in_flight:
+                        raise CircuitOpenError(
+                            f"{self} trial request in flight", request=request
+                        )
+                    self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """
+        Close the circuit after a successful request
+        """
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, alive: bool | None = None) -> None:
+        """
+        Count a failed request, opening the circuit when the threshold is
+        reached, a trial request failed or the endpoint is known to be down
+        """
+        with self._lock:
+            self.failures += 1
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.failures >= self.failure_threshold
+                or alive is False
+            ):
+                self.state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        Let another trial request through after one ended without an outcome,
+        cancelled or failed with an error unrelated to the endpoint
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        """
+        Close the circuit and forget the cached liveness
+        """
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+            self._liveness = None
+
+    def liveness_request(self) -> httpx.Request:
+        """
+        Request checking the endpoint liveness, with a short timeout
+        """
+        return httpx.Request(
+            "GET",
+            self.liveness_url,
+            extensions={"timeout": LIVENESS_TIMEOUT.as_dict()},
+        )
+
+
+@cache
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """
+    Process-wide circuit breaker of an endpoint
+    """
+    return CircuitBreaker(endpoint)
+
+
+class CircuitBreakerTransport(httpx.BaseTransport):
+    """
+    HTTP transport sending the requests for the breaker endpoint through it
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, breaker: CircuitBreaker):
+        self.transport = transport
+        self.breaker = breaker
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.breaker.handles(request):
+            return self.transport.handle_request(request)
+
+        if self.breaker.needs_liveness_check():
+            self.breaker.set_liveness(self.check_liveness())
+        self.breaker.before_request(request)
+
+        try:
+            response = self.transport.handle_request(request)
+        except httpx.TransportError:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release_trial()
+            raise
+
+        if response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.breaker.record_success()
+        return response
+
+    def record_failure(self) -> None:
+        """
+        Record a failed request with the endpoint liveness, or without it
+        when the liveness check is interrupted
+        """
+        try:
+            alive = self.liveness()
+        except BaseException:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_failure(alive)
+
+    def liveness(self) -> bool:
+        """
+        Cached liveness of the endpoint, checked when missing or expired
+        """
+        if (alive := self.breaker.cached_liveness()) is None:
+            alive = self.check_liveness()
+            self.breaker.set_liveness(alive)
+        return alive
+
+    def check_liveness(self) -> bool:
+        """
+        Call the endpoint liveness check
+        """
+        try:
+            response = self.transport.handle_request(self.breaker.liveness_request())
+            response.read()
+            response.close()
+        except httpx.TransportError:
+            return False
+        return response.is_success
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """
+    Async HTTP transport sending the requests for the breaker endpoint through it
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breaker: CircuitBreaker):
+        self.transport = transport
+        self.breaker = breaker
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.breaker.handles(request):
+            return await self.transport.handle_async_request(request)
+
+        if self.breaker.needs_liveness_check():
+            self.breaker.set_liveness(await self.check_liveness())
+        self.breaker.before_request(request)
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError:
+            await self.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release_trial()
+            raise
+
+        if response.status_code >= 500:
+            await self.record_failure()
+        else:
+            self.breaker.record_success()
+        return response
+
+    async def record_failure(self) -> None:
+        """
+        Record a failed request with the endpoint liveness, or without it
+        when the liveness check is cancelled
+        """
+        try:
+            alive = await self.liveness()
+        except BaseException:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_failure(alive)
+
+    async def liveness(self) -> bool:
+        """
+        Cached liveness of the endpoint, checked when missing or expired
+        """
+        if (alive := self.breaker.cached_liveness()) is None:
+            alive = await self.check_liveness()
+            self.breaker.set_liveness(alive)
+        return alive
+
+    async def check_liveness(self) -> bool:
+        """
+        Call the endpoint liveness check
+        """
+        try:
+            response = await self.transport.handle_async_request(
+                self.breaker.liveness_request()
+            )
+            await response.aread()
+            await response.aclose()
+        except httpx.TransportError:
+            return False
+        return response.is_success
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -2,25 +2,67 @@
 Common internal API calls
 """
 
-from pydantic import parse_obj_as
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from typing import Final
+
+import httpx
+from pydantic import BaseModel, parse_obj_as
 
 from common.models.notifications.vbit_snow import PostModel
 from common.models.service import Service
 from common.models.settings import ConfigTMFServices
 
 from . import APIClient
+from .projection import fields_query, projection_model
+
+DEFAULT_PAGE_SIZE: Final[int] = 100
+
+
+@cache
+def get_api_client(endpoint: str) -> APIClient:
+    """
+    Shared APIClient per internal endpoint, so consecutive calls
+    reuse its pooled connections
+    """
+    return APIClient(endpoint=endpoint)
 
 
-def get_inventory_service(tmf_services: ConfigTMFServices, service_id: str) -> Service:
+def get_inventory_service(
+    tmf_services: ConfigTMFServices,
+    service_id: str,
+    fields: Sequence[str] | None = None,
+) -> Service | BaseModel:
     """
     Get Service from Inventory
+    With `fields` only the selected attributes are requested and
+    the response is parsed into a Service projection model
+    Exceptions:
+      - httpx.HTTPError
+      - pydantic.ValidationError
+    """
+    client = get_api_client(tmf_services.service_inventory)
+    response = client.request_get(with_fields("/service/" + service_id, fields))
+    return service_model(fields).parse_obj(response.json())
+
+
+async def async_get_inventory_service(
+    tmf_services: ConfigTMFServices,
+    service_id: str,
+    fields: Sequence[str] | None = None,
+) -> Service | BaseModel:
+    """
+    Get Service from Inventory using asyncio
     Exceptions:
       - httpx.HTTPError
       - pydantic.ValidationError
     """
-    client = APIClient(endpoint=tmf_services.service_inventory)
-    response = client.request_get("/service/" + service_id)
-    return Service.parse_obj(response.json())
+    client = get_api_client(tmf_services.service_inventory)
+    response = await client.async_request_get(
+        with_fields("/service/" + service_id, fields)
+    )
+    return service_model(fields).parse_obj(response.json())
 
 
 def get_inventory_snow_service(
@@ -32,9 +74,11 @@ def get_inventory_snow_service(
       - httpx.HTTPError
       - pydantic.ValidationError
     """
-    client = APIClient(endpoint=tmf_services.service_inventory)
-    response = client.request_get("/service/snow/" + service_id)
-    return parse_obj_as(list[PostModel], response.json())
+    client = get_api_client(tmf_services.service_inventory)
+    return [
+        PostModel.parse_obj(item)
+        for item in client.request_get_items("/service/snow/" + service_id)
+    ]
 
 
 def delete_inventory_service(tmf_services: ConfigTMFServices, service_id: str):
@@ -43,18 +87,118 @@ def delete_inventory_service(tmf_services: ConfigTMFServices, service_id: str):
     Exceptions:
       - httpx.HTTPError
     """
-    client = APIClient(endpoint=tmf_services.service_inventory)
+    client = get_api_client(tmf_services.service_inventory)
     response = client.request_delete("/service/" + service_id)
     return response
 
 
-def get_inventory_services(tmf_services: ConfigTMFServices) -> list[Service]:
+def get_inventory_services(
+    tmf_services: ConfigTMFServices, fields: Sequence[str] | None = None
+) -> list[Service] | list[BaseModel]:
     """
     Get Services from Inventory
+    With `fields` only the selected attributes are requested and
+    the response is parsed into Service projection models
+    Exceptions:
+      - httpx.HTTPError
+      - pydantic.ValidationError
+    """
+    return list(stream_inventory_services(tmf_services, fields))
+
+
+def stream_inventory_services(
+    tmf_services: ConfigTMFServices, fields: Sequence[str] | None = None
+) -> Iterator[Service | BaseModel]:
+    """
+    Get Services from Inventory in a single request, decoding and validating
+    them one at a time while the response is read
+    Exceptions:
+      - httpx.HTTPError
+      - pydantic.ValidationError
+    """
+    client = get_api_client(tmf_services.service_inventory)
+    model = service_model(fields)
+    for item in client.request_get_items(with_fields("/service", fields)):
+        yield model.parse_obj(item)
+
+
+def iter_inventory_services(
+    tmf_services: ConfigTMFServices,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    fields: Sequence[str] | None = None,
+) -> Iterator[Service | BaseModel]:
+    """
+    Iterate over the Services from Inventory page by page using the TMF
+    `offset`/`limit` query parameters, so only one page is held in memory.
+    With `prefetch` the next page is requested while the current one is consumed.
+    Iteration stops once `X-Total-Count` services were read (pages shorter
+    than `page_size` are followed when the server caps `limit`), on a short
+    page when the header is missing, on an empty page or when a page only
+    repeats services of the previous one (the server ignores `offset`).
+    With `fields` Service projection models are yielded instead.
     Exceptions:
       - httpx.HTTPError
       - pydantic.ValidationError
     """
-    client = APIClient(endpoint=tmf_services.service_inventory)
-    response = client.request_get("/service")
-    return parse_obj_as(list[Service], response.json())
+    client = get_api_client(tmf_services.service_inventory)
+    model = service_model(fields)
+
+    def fetch_page(offset: int) -> httpx.Response:
+        return client.request_get(
+            with_fields(f"/service?offset={offset}&limit={page_size}", fields)
+        )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offset = 0
+        previous_ids: set[str] = set()
+        next_page: Future[httpx.Response] | None = executor.submit(fetch_page, offset)
+        while next_page is not None:
+            response = next_page.result()
+            next_page = None
+            page = response.json()
+            page_ids = {item.get("id") for item in page} - {None}
+            if page_ids and page_ids <= previous_ids:
+                return
+            previous_ids = page_ids
+            offset += len(page)
+
+            total_count = _total_count(response)
+            if total_count is None:
+                has_more = len(page) == page_size
+            else:
+                has_more = bool(page) and offset < total_count
+            if has_more and prefetch:
+                next_page = executor.submit(fetch_page, offset)
+
+            yield from parse_obj_as(list[model], page)
+
+            if has_more and not prefetch:
+                next_page = executor.submit(fetch_page, offset)
+
+
+def service_model(fields: Sequence[str] | None) -> type[BaseModel]:
+    """
+    Service, or the Service projection model for the selected attributes
+    """
+    return Service if fields is None else projection_model(Service, fields)
+
+
+def with_fields(resource: str, fields: Sequence[str] | None) -> str:
+    """
+    Add the TMF `fields` query parameter to the resource when selecting attributes
+    """
+    if fields is None:
+        return resource
+    separator = "&" if "?" in resource else "?"
+    return resource + separator + fields_query(fields)
+
+
+def _total_count(response: httpx.Response) -> int | None:
+    """
+    Value of the TMF X-Total-Count header, if present and valid
+    """
+    try:
+        return int(response.headers["X-Total-Count"])
+    except (KeyError, ValueError):
+        return None
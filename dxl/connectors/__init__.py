@@ -1,16 +1,25 @@
 """Exports"""
 
 from .service_catalog_connector import (
+    AsyncServiceCatalogConnectorHttp,
     ServiceCatalogConnector,
     ServiceCatalogConnectorHttp,
     ServiceCatalogConnectorStub,
 )
-from .service_inventory_connector import ServiceInventoryConnector, ServiceInventoryHttp
+from .service_inventory_connector import (
+    AsyncServiceInventoryHttp,
+    ServiceBulkResult,
+    ServiceInventoryConnector,
+    ServiceInventoryHttp,
+)
 
 __all__ = [
     "ServiceCatalogConnector",
     "ServiceCatalogConnectorHttp",
     "ServiceCatalogConnectorStub",
+    "AsyncServiceCatalogConnectorHttp",
     "ServiceInventoryConnector",
     "ServiceInventoryHttp",
+    "AsyncServiceInventoryHttp",
+    "ServiceBulkResult",
 ]
@@ -0,0 +1,234 @@
+"""
+In-process cache for Service Catalog lookups
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Final
+
+import httpx
+
+from .single_flight import SingleFlight
+
+DEFAULT_MAX_SIZE: Final[int] = 1024
+DEFAULT_TTL: Final[float] = 300.0
+DEFAULT_NEGATIVE_TTL: Final[float] = 30.0
+
+
+@dataclass
+class CatalogCacheEntry:
+    """
+    Cached catalog response, either a parsed value or a 404 error
+    """
+
+    expires_at: float
+    value: Any = None
+    etag: str | None = None
+    error: httpx.HTTPStatusError | None = None
+
+
+class CatalogCache:
+    """
+    Bounded LRU cache with TTL for catalog resources.
+    Expired entries holding an ETag are revalidated with If-None-Match,
+    404 responses are cached for `negative_ttl` seconds and concurrent
+    misses for the same key are coalesced into one request.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict[Hashable, CatalogCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+    def get_entry(self, key: Hashable) -> CatalogCacheEntry | None:
+        """
+        Cached entry for the key, fresh or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, etag: str | None = None) -> None:
+        """
+        Cache a parsed value for `ttl` seconds
+        """
+        self._store(
+            key,
+            CatalogCacheEntry(
+                expires_at=time.monotonic() + self.ttl, value=value, etag=etag
+            ),
+        )
+
+    def set_error(self, key: Hashable, error: httpx.HTTPStatusError) -> None:
+        """
+        Cache a not found error for `negative_ttl` seconds
+        """
+        self._store(
+            key,
+            CatalogCacheEntry(
+                expires_at=time.monotonic() + self.negative_ttl,
+                error=_copy_error(error),
+            ),
+        )
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop the cached entry for the key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all cached entries
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[dict[str, str] | None], httpx.Response],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Cached value for the key, calling `fetch(headers)` and `parse(json)`
+        when it is missing or expired. Concurrent misses for the same key
+        share a single fetch. Every call gets its own copy of the value.
+        Exceptions:
+        - httpx.HTTPError
+        - pydantic.ValidationError
+        """
+        entry = self.get_entry(key)
+        if self._is_fresh(entry):
+            value = self._cached_value(entry)
+        else:
+            value = self._single_flight.do(key, lambda: self._fetch(key, fetch, parse))
+        return copy.deepcopy(value)
+
+    async def async_get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[dict[str, str] | None], Awaitable[httpx.Response]],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        """
+        Asyncio version of `get_or_fetch`, concurrent misses for the same key
+        of an event loop share a single fetch.
+        Exceptions:
+        - httpx.HTTPError
+        - pydantic.ValidationError
+        """
+        entry = self.get_entry(key)
+        if self._is_fresh(entry):
+            value = self._cached_value(entry)
+        else:
+            value = await self._single_flight.do_async(
+                key, lambda: self._async_fetch(key, fetch, parse)
+            )
+        return copy.deepcopy(value)
+
+    def _fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[dict[str, str] | None], httpx.Response],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        entry = self.get_entry(key)
+        if self._is_fresh(entry):
+            # Refreshed by a call that completed while this one was waiting
+            return self._cached_value(entry)
+
+        try:
+            response = fetch(self._conditional_headers(entry))
+        except httpx.HTTPStatusError as http_error:
+            self._store_not_found(key, http_error)
+            raise
+        return self._store_response(key, entry, response, parse)
+
+    async def _async_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[dict[str, str] | None], Awaitable[httpx.Response]],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        entry = self.get_entry(key)
+        if self._is_fresh(entry):
+            # Refreshed by a call that completed while this one was waiting
+            return self._cached_value(entry)
+
+        try:
+            response = await fetch(self._conditional_headers(entry))
+        except httpx.HTTPStatusError as http_error:
+            self._store_not_found(key, http_error)
+            raise
+        return self._store_response(key, entry, response, parse)
+
+    @staticmethod
+    def _conditional_headers(entry: CatalogCacheEntry | None) -> dict[str, str] | None:
+        if entry is not None and entry.etag is not None:
+            return {"If-None-Match": entry.etag}
+        return None
+
+    def _store_not_found(
+        self, key: Hashable, http_error: httpx.HTTPStatusError
+    ) -> None:
+        if http_error.response.status_code == httpx.codes.NOT_FOUND:
+            self.set_error(key, http_error)
+
+    def _store_response(
+        self,
+        key: Hashable,
+        entry: CatalogCacheEntry | None,
+        response: httpx.Response,
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+            self.set(key, entry.value, response.headers.get("ETag", entry.etag))
+            return entry.value
+
+        value = parse(response.json())
+        self.set(key, value, response.headers.get("ETag"))
+        return value
+
+    @staticmethod
+    def _is_fresh(entry: CatalogCacheEntry | None) -> bool:
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    @staticmethod
+    def _cached_value(entry: CatalogCacheEntry) -> Any:
+        if entry.error is not None:
+            # A fresh exception per call, re-raising the cached one would keep
+            # growing its traceback
+            raise _copy_error(entry.error)
+        return entry.value
+
+    def _store(self, key: Hashable, entry: CatalogCacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+CATALOG_CACHE = CatalogCache()
+
+
+def _copy_error(error: httpx.HTTPStatusError) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError(
+        str(error), request=error.request, response=error.response
+    )
@@ -3,7 +3,10 @@ Service Catalog Connector
 """
 
 import json
-from typing import Protocol
+from collections.abc import Callable, Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Protocol, TypeVar
 
 import httpx
 from fastapi import HTTPException, Request
@@ -33,16 +36,19 @@ from common.models.enums import (
     VelocloudServiceType,
 )
 from common.models.settings import ConfigTMFServices
-from common.southbound.dxl.api_client import APIClient
+from common.southbound.dxl.common_methods import get_api_client
 from common.tools import TMFLogger
 from common.tools.tmf_href import make_host_url
 
+from .catalog_cache import CATALOG_CACHE, CatalogCache
 from .messages import CatalogConnectorMessages as Messages
 
 logger = TMFLogger()
 VALUE_SCHEMA_LOCATION = "@valueSchemaLocation"
 PARTY_MANAGEMENT_SPECIFICATION_NAME = "Party Management"
 
+T = TypeVar("T")
+
 
 class ServiceCatalogConnector(Protocol):
     """
@@ -87,8 +93,15 @@ class ServiceCatalogConnectorHttp:
     Service Catalog Connector HTTP
     """
 
-    def __init__(self, tmf_serivces: ConfigTMFServices):
+    def __init__(
+        self, tmf_serivces: ConfigTMFServices, cache: CatalogCache = CATALOG_CACHE
+    ):
+        """
+        Specifications and schemas are kept in `cache`, shared by default
+        by every connector of the process
+        """
         self.tmf_services: ConfigTMFServices = tmf_serivces
+        self.cache = cache
 
     def get_schema_by_id(self, schema_id) -> ServiceSchemaCreate:
         """
@@ -97,9 +110,11 @@ class ServiceCatalogConnectorHttp:
         - httpx.HTTPError
         - pydantic.ValidationError
         """
-        client = APIClient(endpoint=self.tmf_services.service_catalog)
-        response = client.request_get(f"serviceSchema/{schema_id}")
-        return parse_obj_as(ServiceSchemaCreate, response.json())
+        return self._get_cached(
+            ("serviceSchema", schema_id),
+            f"serviceSchema/{schema_id}",
+            lambda data: parse_obj_as(ServiceSchemaCreate, data),
+        )
 
     def get_service_specification_by_id(self, id_: str) -> ServiceSpecification:
         """
@@ -108,9 +123,11 @@ class ServiceCatalogConnectorHttp:
         - httpx.HTTPError
         - pydantic.ValidationError
         """
-        client = APIClient(endpoint=self.tmf_services.service_catalog)
-        response = client.request_get(f"/serviceSpecification/{id_}")
-        return parse_obj_as(ServiceSpecification, response.json())
+        return self._get_cached(
+            ("serviceSpecification", id_),
+            f"/serviceSpecification/{id_}",
+            lambda data: parse_obj_as(ServiceSpecification, data),
+        )
 
     def get_service_specification_by_name_version_pair(
         self, name: str, version: str
@@ -121,13 +138,24 @@ class ServiceCatalogConnectorHttp:
         - httpx.HTTPError
         - pydantic.ValidationError
         """
-        client = APIClient(endpoint=self.tmf_services.service_catalog)
-        response = client.request_get(
-            f"/serviceSpecification?name={name}&version={version}"
+        specifications = self._get_cached(
+            ("serviceSpecification", name, version),
+            f"/serviceSpecification?name={name}&version={version}",
+            lambda data: parse_obj_as(list[ServiceSpecification], data),
         )
-        specifications = parse_obj_as(list[ServiceSpecification], response.json())
         return specifications[0]
 
+    def _get_cached(self, key: tuple, resource: str, parse: Callable[[Any], T]) -> T:
+        """
+        Get a catalog resource through the cache, keyed by catalog endpoint
+        """
+        client = get_api_client(self.tmf_services.service_catalog)
+        return self.cache.get_or_fetch(
+            (str(self.tmf_services.service_catalog), *key),
+            lambda headers: client.request_get(resource, headers=headers),
+            parse,
+        )
+
     def get_service_specification(self, service: Service) -> ServiceSpecification:
         """
         Get service specification data from Catalog API by id if the
@@ -203,31 +231,123 @@ class ServiceCatalogConnectorHttp:
         return get_catalog_href(request, spec_id, self.tmf_services)
 
 
+class AsyncServiceCatalogConnectorHttp:
+    """
+    Class containing the asyncio methods for interacting
+    with the Service Catalog via API
+    """
+
+    def __init__(
+        self, tmf_services: ConfigTMFServices, cache: CatalogCache = CATALOG_CACHE
+    ):
+        """
+        Specifications and schemas are kept in `cache`, shared by default
+        with the synchronous connectors of the process
+        """
+        self.tmf_services: ConfigTMFServices = tmf_services
+        self.cache = cache
+
+    async def get_schema_by_id(self, schema_id) -> ServiceSchemaCreate:
+        """
+        Get schema by schema id from Catalog
+        Exceptions:
+        - httpx.HTTPError
+        - pydantic.ValidationError
+        """
+        return await self._get_cached(
+            ("serviceSchema", schema_id),
+            f"serviceSchema/{schema_id}",
+            lambda data: parse_obj_as(ServiceSchemaCreate, data),
+        )
+
+    async def get_service_specification_by_id(self, id_: str) -> ServiceSpecification:
+        """
+        Get Service Specification from Catalog
+        Exceptions:
+        - httpx.HTTPError
+        - pydantic.ValidationError
+        """
+        return await self._get_cached(
+            ("serviceSpecification", id_),
+            f"/serviceSpecification/{id_}",
+            lambda data: parse_obj_as(ServiceSpecification, data),
+        )
+
+    async def get_service_specification_by_name_version_pair(
+        self, name: str, version: str
+    ) -> ServiceSpecification:
+        """
+        Get Service Specification from Catalog by name and version
+        Exceptions:
+        - httpx.HTTPError
+        - pydantic.ValidationError
+        """
+        specifications = await self._get_cached(
+            ("serviceSpecification", name, version),
+            f"/serviceSpecification?name={name}&version={version}",
+            lambda data: parse_obj_as(list[ServiceSpecification], data),
+        )
+        return specifications[0]
+
+    async def _get_cached(
+        self, key: tuple, resource: str, parse: Callable[[Any], T]
+    ) -> T:
+        """
+        Get a catalog resource through the cache, keyed by catalog endpoint
+        """
+        client = get_api_client(self.tmf_services.service_catalog)
+        return await self.cache.async_get_or_fetch(
+            (str(self.tmf_services.service_catalog), *key),
+            lambda headers: client.async_request_get(resource, headers=headers),
+            parse,
+        )
+
+
 class ServiceCatalogConnectorStub:
     """
     Service Catalog Connector Stub
     """
 
     def __init__(self, tmf_services):
+        """
+        Specifications are only built when first looked up, and kept by the
+        stub so the id and the name and version lookups return the same object
+        """
         self.tmf_services: ConfigTMFServices = tmf_services
-        self.available_schemas_by_id: dict[str, ServiceSchemaCreate] = {
-            schema.schema_id: schema for schema in AVAILABLE_SCHEMAS
-        }
-        self.available_specs_by_id: dict[str, ServiceSpecification] = {
-            generate_specification_id(specification.name): ServiceSpecification(
-                id=generate_specification_id(specification.name),
-                **specification.dict(),
-            )
-            for specification in AVAILABLE_SPECIFICATIONS
+        self._schemas_by_id: dict[str, ServiceSchemaCreate] | None = None
+        self._specifications: dict[int, ServiceSpecification] = {}
+
+    @property
+    def available_schemas_by_id(self) -> dict[str, ServiceSchemaCreate]:
+        """
+        Available schemas by schema id
+        """
+        if self._schemas_by_id is None:
+            self._schemas_by_id = {
+                schema.schema_id: schema for schema in AVAILABLE_SCHEMAS
+            }
+        return self._schemas_by_id
+
+    @property
+    def available_specs_by_id(self) -> dict[str, ServiceSpecification]:
+        """
+        All available specifications by id, builds every specification
+        """
+        return {
+            id_: self._specification(index)
+            for id_, index in specification_indexes_by_id().items()
         }
-        self.available_specs_by_name_and_version: dict[
-            tuple[str, str], ServiceSpecification
-        ] = {
-            (specification.name, specification.version): ServiceSpecification(
-                id=generate_specification_id(specification.name),
-                **specification.dict(),
-            )
-            for specification in AVAILABLE_SPECIFICATIONS
+
+    @property
+    def available_specs_by_name_and_version(
+        self,
+    ) -> dict[tuple[str, str], ServiceSpecification]:
+        """
+        All available specifications by name and version, builds every specification
+        """
+        return {
+            key: self._specification(index)
+            for key, index in specification_indexes_by_name_and_version().items()
         }
 
     def get_schema_by_id(self, schema_id) -> ServiceSchemaCreate | None:
@@ -240,7 +360,8 @@ class ServiceCatalogConnectorStub:
         """
         Get Service Specification from memory
         """
-        return self.available_specs_by_id.get(id_)
+        index = specification_indexes_by_id().get(id_)
+        return None if index is None else self._specification(index)
 
     def get_service_specification_by_name_version_pair(
         self, name: str, version: str
@@ -248,7 +369,8 @@ class ServiceCatalogConnectorStub:
         """
         Get Service Specification from memory by name and version
         """
-        return self.available_specs_by_name_and_version.get((name, version))
+        index = specification_indexes_by_name_and_version().get((name, version))
+        return None if index is None else self._specification(index)
 
     def get_service_specification(self, service: Service) -> ServiceSpecification:
         """
@@ -321,6 +443,14 @@ class ServiceCatalogConnectorStub:
         """Generates catalog href for specification"""
         return get_catalog_href(request, spec_id, self.tmf_services)
 
+    def _specification(self, index: int) -> ServiceSpecification:
+        """
+        Specification of an AVAILABLE_SPECIFICATIONS entry, built on first use
+        """
+        if (specification := self._specifications.get(index)) is None:
+            specification = self._specifications[index] = stub_specification(index)
+        return specification
+
 
 def is_specification_name_valid(specification_name: str | None) -> bool:
     """
@@ -435,3 +565,40 @@ def generate_specification_id(spec_name: str) -> str:
     Mainly used for AVAILABLE_SPECIFICATIONS
     """
     return f"{spec_name}-specification-id".replace(" ", "")
+
+
+@cache
+def specification_indexes_by_id() -> Mapping[str, int]:
+    """
+    Position in AVAILABLE_SPECIFICATIONS of each specification id
+    """
+    return MappingProxyType(
+        {
+            generate_specification_id(specification.name): index
+            for index, specification in enumerate(AVAILABLE_SPECIFICATIONS)
+        }
+    )
+
+
+@cache
+def specification_indexes_by_name_and_version() -> Mapping[tuple[str, str], int]:
+    """
+    Position in AVAILABLE_SPECIFICATIONS of each specification name and version
+    """
+    return MappingProxyType(
+        {
+            (specification.name, specification.version): index
+            for index, specification in enumerate(AVAILABLE_SPECIFICATIONS)
+        }
+    )
+
+
+def stub_specification(index: int) -> ServiceSpecification:
+    """
+    New ServiceSpecification of an AVAILABLE_SPECIFICATIONS entry
+    """
+    specification = AVAILABLE_SPECIFICATIONS[index]
+    return ServiceSpecification(
+        id=generate_specification_id(specification.name),
+        **specification.dict(),
+    )
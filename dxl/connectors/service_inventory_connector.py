@@ -2,16 +2,19 @@
 Service Inventory Connector
 """
 
-from typing import Protocol
+import asyncio
+from collections.abc import Iterable, Sequence
+from typing import Final, NamedTuple, Protocol
 
 from httpx import HTTPError
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from structlog import get_logger
 
 from common.models import Service
 from common.models.notifications.vbit_snow import PostModel
 from common.models.settings import ConfigTMFServices
 from common.southbound.dxl.common_methods import (
+    async_get_inventory_service,
     delete_inventory_service,
     get_inventory_service,
     get_inventory_snow_service,
@@ -19,15 +22,20 @@ from common.southbound.dxl.common_methods import (
 
 logger = get_logger()
 
+DEFAULT_CONCURRENCY: Final[int] = 10
+
 
 class ServiceInventoryConnector(Protocol):
     """
     Interface used to interact with Service Inventory
     """
 
-    def get_service(self, service_id: str | None) -> Service | None:
+    def get_service(
+        self, service_id: str | None, fields: Sequence[str] | None = None
+    ) -> Service | BaseModel | None:
         """
-        Method to get a service from a service id
+        Method to get a service from a service id,
+        optionally only the selected `fields`
         """
 
     def delete_service(self, service_id: str) -> None:
@@ -72,16 +80,19 @@ class ServiceInventoryHttp:
 
         return post_model
 
-    def get_service(self, service_id: str | None) -> Service | None:
+    def get_service(
+        self, service_id: str | None, fields: Sequence[str] | None = None
+    ) -> Service | BaseModel | None:
         """
         Get Service data from Inventory API
+        With `fields` only the selected attributes are fetched and validated
         """
         if service_id is None:
             logger.error("VBIT SNOW Convertor: Service ID is None")
             return None
 
         try:
-            service = get_inventory_service(self.tmf_services, service_id)
+            service = get_inventory_service(self.tmf_services, service_id, fields)
         except HTTPError:
             logger.warning(
                 "Error getting service from the Service Inventory API.",
@@ -107,3 +118,93 @@ class ServiceInventoryHttp:
                 base_url=self.tmf_services.service_inventory,
                 service_id=service_id,
             )
+
+
+class ServiceBulkResult(NamedTuple):
+    """
+    Services fetched by id, and the error raised for each id that failed
+    """
+
+    services: dict[str, Service | BaseModel]
+    errors: dict[str, Exception]
+
+
+class AsyncServiceInventoryHttp:
+    """
+    Class containing the asyncio methods for interacting
+    with the Service Inventory via API
+    """
+
+    def __init__(
+        self, tmf_services: ConfigTMFServices, concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        self.tmf_services = tmf_services
+        self.concurrency = concurrency
+
+    async def get_service(
+        self, service_id: str | None, fields: Sequence[str] | None = None
+    ) -> Service | BaseModel | None:
+        """
+        Get Service data from Inventory API
+        With `fields` only the selected attributes are fetched and validated
+        """
+        if service_id is None:
+            logger.error("VBIT SNOW Convertor: Service ID is None")
+            return None
+
+        try:
+            return await async_get_inventory_service(
+                self.tmf_services, service_id, fields
+            )
+        except HTTPError:
+            logger.warning(
+                "Error getting service from the Service Inventory API.",
+                base_url=self.tmf_services.service_inventory,
+                service_id=service_id,
+            )
+        except ValidationError:
+            logger.error("Error Validating API Response", exc_info=True)
+        return None
+
+    async def get_services(
+        self,
+        service_ids: Iterable[str | None],
+        fields: Sequence[str] | None = None,
+    ) -> ServiceBulkResult:
+        """
+        Get several Services from Inventory API concurrently, with at most
+        `concurrency` requests in flight. Repeated and None ids are fetched once
+        or skipped, a failing id is reported in `errors` without stopping the others.
+        """
+        unique_ids = [
+            service_id
+            for service_id in dict.fromkeys(service_ids)
+            if service_id is not None
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(service_id: str) -> Service | BaseModel:
+            async with semaphore:
+                return await async_get_inventory_service(
+                    self.tmf_services, service_id, fields
+                )
+
+        results = await asyncio.gather(
+            *(fetch(service_id) for service_id in unique_ids), return_exceptions=True
+        )
+
+        bulk_result = ServiceBulkResult(services={}, errors={})
+        for service_id, result in zip(unique_ids, results):
+            if isinstance(result, (HTTPError, ValidationError)):
+                logger.warning(
+                    "Error getting service from the Service Inventory API.",
+                    base_url=self.tmf_services.service_inventory,
+                    service_id=service_id,
+                    error=str(result),
+                )
+                bulk_result.errors[service_id] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                bulk_result.services[service_id] = result
+        return bulk_result
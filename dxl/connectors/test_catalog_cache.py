@@ -0,0 +1,102 @@
+"""
+Tests for the Service Catalog cache
+"""
+
+import asyncio
+
+import httpx
+
+from common.southbound.dxl.connectors.catalog_cache import CatalogCache
+
+
+def test_async_get_or_fetch_concurrent_misses():
+    """
+    Test if concurrent asyncio lookups of the same key share a single fetch
+    and later lookups are served from the cache
+    """
+    cache = CatalogCache()
+    calls = []
+
+    async def fetch(headers):
+        calls.append(headers)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "spec"}, headers={"ETag": '"1"'})
+
+    async def lookups():
+        first = await asyncio.gather(
+            *(
+                cache.async_get_or_fetch("spec", fetch, lambda data: data["id"])
+                for _ in range(10)
+            )
+        )
+        return first, await cache.async_get_or_fetch(
+            "spec", fetch, lambda data: data["id"]
+        )
+
+    values, cached = asyncio.run(lookups())
+
+    assert values == ["spec"] * 10
+    assert cached == "spec"
+    assert calls == [None]
+
+
+def test_async_get_or_fetch_not_modified():
+    """
+    Test if an expired entry is revalidated with its ETag and kept on 304
+    """
+    cache = CatalogCache(ttl=0)
+    cache.set("spec", "cached", etag='"1"')
+    calls = []
+
+    async def fetch(headers):
+        calls.append(headers)
+        return httpx.Response(304)
+
+    value = asyncio.run(cache.async_get_or_fetch("spec", fetch, lambda data: data))
+
+    assert value == "cached"
+    assert calls == [{"If-None-Match": '"1"'}]
+
+
+def test_get_or_fetch_returns_copies():
+    """
+    Test if every lookup gets its own copy of the cached value
+    """
+    cache = CatalogCache()
+
+    def fetch(headers):
+        return httpx.Response(200, json={"id": "spec", "tags": []})
+
+    first = cache.get_or_fetch("spec", fetch, lambda data: data)
+    first["tags"].append("changed")
+    second = cache.get_or_fetch("spec", fetch, lambda data: data)
+
+    assert second == {"id": "spec", "tags": []}
+    assert second is not cache.get_entry("spec").value
+
+
+def test_get_or_fetch_not_found_raises_fresh_errors():
+    """
+    Test if a cached 404 is raised as a new exception on every lookup
+    """
+    cache = CatalogCache()
+    request = httpx.Request("GET", "https://catalog/spec")
+    calls = []
+
+    def fetch(headers):
+        calls.append(headers)
+        response = httpx.Response(404, request=request)
+        response.raise_for_status()
+
+    errors = []
+    for _ in range(3):
+        try:
+            cache.get_or_fetch("spec", fetch, lambda data: data)
+        except httpx.HTTPStatusError as http_error:
+            errors.append(http_error)
+
+    assert len(calls) == 1
+    assert len(errors) == 3
+    assert len({id(error) for error in errors}) == 3
+    assert all(error.response.status_code == 404 for error in errors)
+    assert str(errors[1]) == str(errors[0])
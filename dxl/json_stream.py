@@ -0,0 +1,125 @@
+"""
+Incremental decoding of top level JSON arrays
+"""
+
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+# A value ending with one of these can not be continued by the next chunk
+_CLOSING_CHARACTERS = '}]"'
+
+
+class JSONArrayDecoder:
+    """
+    Decode the elements of a top level JSON array from text chunks,
+    only the current element is buffered.
+    Exceptions:
+      - json.JSONDecodeError
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._state = "start"
+
+    def feed(self, text: str) -> Iterator[Any]:
+        """
+        Add a chunk of text and yield the elements completed by it
+        """
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        yield from self._decode(final=False)
+
+    def close(self) -> Iterator[Any]:
+        """
+        Yield the remaining elements once the input is exhausted
+        and check the array was terminated
+        """
+        yield from self._decode(final=True)
+        if self._state != "end":
+            raise json.JSONDecodeError(
+                "Unterminated JSON array", self._buffer, self._position
+            )
+
+    def _decode(self, final: bool) -> Iterator[Any]:
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in _WHITESPACE
+            ):
+                self._position += 1
+            if self._position == len(self._buffer):
+                return
+
+            character = self._buffer[self._position]
+            match self._state:
+                case "start":
+                    self._expect(character, "[")
+                    self._state = "first"
+                case "first" if character == "]":
+                    self._position += 1
+                    self._state = "end"
+                case "first" | "value":
+                    try:
+                        item, end = self._decoder.raw_decode(
+                            self._buffer, self._position
+                        )
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        return
+                    if (
+                        not final
+                        and self._buffer[end - 1] not in _CLOSING_CHARACTERS
+                        and (
+                            end == len(self._buffer)
+                            or self._buffer[end] not in _DELIMITERS
+                        )
+                    ):
+                        # A number or literal may continue in the next chunk
+                        return
+                    self._position = end
+                    self._state = "separator"
+                    yield item
+                case "separator":
+                    self._expect(character, ",]")
+                    self._state = "value" if character == "," else "end"
+                case _:
+                    raise json.JSONDecodeError(
+                        "Extra data", self._buffer, self._position
+                    )
+
+    def _expect(self, character: str, expected: str) -> None:
+        if character not in expected:
+            raise json.JSONDecodeError(
+                f"Expecting {' or '.join(map(repr, expected))}",
+                self._buffer,
+                self._position,
+            )
+        self._position += 1
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array read from text chunks
+    """
+    decoder = JSONArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[str]) -> AsyncIterator[Any]:
+    """
+    Yield the elements of a JSON array read from async text chunks
+    """
+    decoder = JSONArrayDecoder()
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
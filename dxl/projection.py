@@ -0,0 +1,68 @@
+"""
+TMF `fields` attribute selection helpers
+"""
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Optional
+
+from pydantic import BaseModel, Field, create_model
+
+# Attributes returned by TMF APIs whatever the selection
+ALWAYS_SELECTED_FIELDS: tuple[str, ...] = ("id", "href")
+
+
+def normalize_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """
+    Deduplicated, sorted top level attribute names including the ones
+    always returned, so equal selections share the same projection model
+    """
+    return tuple(sorted({*fields, *ALWAYS_SELECTED_FIELDS}))
+
+
+def fields_query(fields: Iterable[str]) -> str:
+    """
+    TMF `fields` query parameter selecting the given attributes
+    """
+    return "fields=" + ",".join(normalize_fields(fields))
+
+
+def projection_model(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """
+    Model validating only the selected attributes of `model`, all optional.
+    Attributes may be selected by name or alias, unknown attributes raise
+    a ValueError.
+    """
+    return _projection_model(model, normalize_fields(fields))
+
+
+@cache
+def _projection_model(
+    model: type[BaseModel], fields: tuple[str, ...]
+) -> type[BaseModel]:
+    model_fields = {
+        key: model_field
+        for model_field in model.__fields__.values()
+        for key in (model_field.name, model_field.alias)
+    }
+    unknown_fields = [
+        field
+        for field in fields
+        if field not in model_fields and field not in ALWAYS_SELECTED_FIELDS
+    ]
+    if unknown_fields:
+        raise ValueError(f"Unknown {model.__name__} fields: {unknown_fields}")
+
+    selected_fields = {
+        model_field.name: (
+            Optional[model_field.outer_type_],
+            Field(default=None, alias=model_field.alias),
+        )
+        for field in fields
+        if (model_field := model_fields.get(field)) is not None
+    }
+    return create_model(
+        f"{model.__name__}Projection",
+        __config__=model.__config__,
+        **selected_fields,
+    )
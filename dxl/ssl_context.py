@@ -0,0 +1,67 @@
+"""
+Process-wide cache of mutual TLS SSL contexts
+"""
+
+import hashlib
+import os
+import ssl
+import threading
+from tempfile import TemporaryDirectory
+
+import httpx
+
+from . import models
+
+_ssl_contexts: dict[str, ssl.SSLContext] = {}
+_ssl_contexts_lock = threading.Lock()
+
+
+def certificate_fingerprint(mutual_ssl: models.MutualSSLConfig) -> str:
+    """
+    SHA-256 fingerprint of the certificate, private key and passphrase
+    """
+    digest = hashlib.sha256()
+    for part in (
+        mutual_ssl.cert_public,
+        mutual_ssl.cert_private,
+        mutual_ssl.cert_passphrase or "",
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_ssl_context(mutual_ssl: models.MutualSSLConfig) -> ssl.SSLContext:
+    """
+    SSL context presenting the client certificate, loaded once per process
+    and shared by every client using the same certificate
+    """
+    fingerprint = certificate_fingerprint(mutual_ssl)
+    with _ssl_contexts_lock:
+        if (context := _ssl_contexts.get(fingerprint)) is None:
+            context = _ssl_contexts[fingerprint] = load_ssl_context(mutual_ssl)
+        return context
+
+
+def load_ssl_context(mutual_ssl: models.MutualSSLConfig) -> ssl.SSLContext:
+    """
+    ssl only loads certificate chains from files, so they are written to a
+    private temporary directory which is removed as soon as they are loaded
+    """
+    context = httpx.create_ssl_context()
+    with TemporaryDirectory() as cert_dir:
+        cert_path = os.path.join(cert_dir, "cert.pem")
+        key_path = os.path.join(cert_dir, "key.pem")
+        for path, content in (
+            (cert_path, mutual_ssl.cert_public),
+            (key_path, mutual_ssl.cert_private),
+        ):
+            with open(
+                os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600),
+                "w",
+                encoding="utf-8",
+            ) as cert_file:
+                cert_file.write(content)
+
+        context.load_cert_chain(cert_path, key_path, mutual_ssl.cert_passphrase)
+    return context
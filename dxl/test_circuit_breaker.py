@@ -0,0 +1,90 @@
+"""
+Tests for the circuit breaker of the internal TMF APIs
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from common.southbound.dxl.circuit_breaker import (
+    AsyncCircuitBreakerTransport,
+    CircuitBreaker,
+    CircuitBreakerTransport,
+    CircuitState,
+)
+
+ENDPOINT = "http://catalog"
+
+
+def half_open_due_breaker() -> CircuitBreaker:
+    """
+    Open breaker due for recovery, with a live endpoint
+    """
+    breaker = CircuitBreaker(ENDPOINT, recovery_timeout=0)
+    breaker.state = CircuitState.OPEN
+    breaker.opened_at = time.monotonic() - 1
+    breaker.set_liveness(True)
+    return breaker
+
+
+def test_trial_request_error_releases_trial():
+    """
+    Test if a trial request failing with a non transport error lets
+    the next request through as a new trial
+    """
+    breaker = half_open_due_breaker()
+    responses = iter([RuntimeError("bug"), httpx.Response(200)])
+
+    def handler(_):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = httpx.Client(
+        transport=CircuitBreakerTransport(httpx.MockTransport(handler), breaker)
+    )
+
+    with pytest.raises(RuntimeError):
+        client.get(f"{ENDPOINT}/serviceSpecification")
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    assert client.get(f"{ENDPOINT}/serviceSpecification").status_code == 200
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_cancelled_trial_request_releases_trial():
+    """
+    Test if a cancelled async trial request lets the next request through
+    as a new trial
+    """
+    breaker = half_open_due_breaker()
+    started = asyncio.Event()
+    calls = 0
+
+    async def handler(_):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    async def requests():
+        async with httpx.AsyncClient(
+            transport=AsyncCircuitBreakerTransport(
+                httpx.MockTransport(handler), breaker
+            )
+        ) as client:
+            trial = asyncio.create_task(client.get(f"{ENDPOINT}/serviceSpecification"))
+            await started.wait()
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            assert breaker.state == CircuitState.HALF_OPEN
+            return await client.get(f"{ENDPOINT}/serviceSpecification")
+
+    assert asyncio.run(requests()).status_code == 200
+    assert breaker.state == CircuitState.CLOSED
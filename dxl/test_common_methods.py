@@ -0,0 +1,72 @@
+"""
+Tests for the common internal API calls
+"""
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from common.southbound.dxl import common_methods
+from common.southbound.dxl.common_methods import iter_inventory_services
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_inventory_services_offset_ignored(mocker: MockerFixture, prefetch):
+    """
+    Test if iteration stops when the server ignores offset/limit and keeps
+    returning the same full page without X-Total-Count
+    """
+    page = [{"id": "1"}, {"id": "2"}]
+    client = MagicMock()
+    client.request_get.side_effect = lambda _: httpx.Response(200, json=page)
+    mocker.patch.object(common_methods, "get_api_client", return_value=client)
+
+    services = list(
+        iter_inventory_services(
+            MagicMock(), page_size=2, prefetch=prefetch, fields=["id"]
+        )
+    )
+
+    assert [service.id for service in services] == ["1", "2"]
+    assert client.request_get.call_count == 2
+
+
+def test_iter_inventory_services_pages(mocker: MockerFixture):
+    """
+    Test if every page is read until a short page is returned
+    """
+    pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}, {"id": "4"}], [{"id": "5"}]]
+    client = MagicMock()
+    client.request_get.side_effect = [httpx.Response(200, json=p) for p in pages]
+    mocker.patch.object(common_methods, "get_api_client", return_value=client)
+
+    services = list(iter_inventory_services(MagicMock(), page_size=2, fields=["id"]))
+
+    assert [service.id for service in services] == ["1", "2", "3", "4", "5"]
+
+
+def test_iter_inventory_services_capped_limit(mocker: MockerFixture):
+    """
+    Test if pages shorter than the requested limit are followed while
+    X-Total-Count says more services remain
+    """
+    services_data = [{"id": str(index)} for index in range(5)]
+    client = MagicMock()
+
+    def request_get(resource):
+        offset = int(resource.split("offset=")[1].split("&")[0])
+        return httpx.Response(
+            200,
+            json=services_data[offset : offset + 2],
+            headers={"X-Total-Count": str(len(services_data))},
+        )
+
+    client.request_get.side_effect = request_get
+    mocker.patch.object(common_methods, "get_api_client", return_value=client)
+
+    services = list(iter_inventory_services(MagicMock(), page_size=4, fields=["id"]))
+
+    assert [service.id for service in services] == ["0", "1", "2", "3", "4"]
+    assert client.request_get.call_count == 3
@@ -0,0 +1,125 @@
+"""
+Process-wide OAuth token cache shared by the DXL API clients
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Final, NamedTuple
+
+from . import models
+
+DEFAULT_REFRESH_MARGIN: Final[float] = 60.0
+
+
+class TokenKey(NamedTuple):
+    """
+    Identity of an OAuth client credentials token
+    """
+
+    token_endpoint: str
+    client_id: str
+    scope: str
+
+
+def token_expires_at(token: models.TokenResponse) -> float:
+    """
+    Unix timestamp at which the token expires
+    """
+    return int(token.issued_at) / 1000 + int(token.expires_in)
+
+
+class TokenCache:
+    """
+    OAuth tokens cached per token endpoint, client id and scope.
+    Tokens are refreshed `refresh_margin` seconds ahead of expiry (at most
+    a tenth of their lifetime) and concurrent callers needing the same token
+    wait for a single in-flight refresh, behind a threading.Lock for threads
+    and an asyncio.Lock for the tasks of an event loop.
+    """
+
+    def __init__(self, refresh_margin: float = DEFAULT_REFRESH_MARGIN):
+        self.refresh_margin = refresh_margin
+        self._tokens: dict[TokenKey, models.TokenResponse] = {}
+        self._locks: dict[TokenKey, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self._async_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[TokenKey, asyncio.Lock]
+        ] = weakref.WeakKeyDictionary()
+
+    def is_fresh(self, token: models.TokenResponse | None) -> bool:
+        """
+        Check if the token is valid and not due for an early refresh
+        """
+        if token is None:
+            return False
+        expires_at = token_expires_at(token)
+        margin = min(self.refresh_margin, int(token.expires_in) / 10)
+        return time.time() < expires_at - margin
+
+    def get(self, key: TokenKey) -> models.TokenResponse | None:
+        """
+        Cached token for the key if it is still fresh
+        """
+        token = self._tokens.get(key)
+        return token if self.is_fresh(token) else None
+
+    def get_or_fetch(
+        self, key: TokenKey, fetch: Callable[[], models.TokenResponse]
+    ) -> models.TokenResponse:
+        """
+        Cached token for the key, calling `fetch` (single-flight) when
+        there is no fresh one
+        """
+        if (token := self.get(key)) is not None:
+            return token
+
+        with self._lock(key):
+            if (token := self.get(key)) is not None:
+                return token
+            token = fetch()
+            self._tokens[key] = token
+            return token
+
+    async def async_get_or_fetch(
+        self, key: TokenKey, fetch: Callable[[], Awaitable[models.TokenResponse]]
+    ) -> models.TokenResponse:
+        """
+        Cached token for the key, awaiting `fetch` (single-flight within
+        the running event loop) when there is no fresh one
+        """
+        if (token := self.get(key)) is not None:
+            return token
+
+        async with self._async_lock(key):
+            if (token := self.get(key)) is not None:
+                return token
+            token = await fetch()
+            self._tokens[key] = token
+            return token
+
+    def invalidate(self, key: TokenKey) -> None:
+        """
+        Drop the cached token, e.g. after it was rejected
+        """
+        self._tokens.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all cached tokens
+        """
+        self._tokens.clear()
+
+    def _lock(self, key: TokenKey) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _async_lock(self, key: TokenKey) -> asyncio.Lock:
+        with self._locks_lock:
+            loop_locks = self._async_locks.setdefault(asyncio.get_running_loop(), {})
+            return loop_locks.setdefault(key, asyncio.Lock())
+
+
+TOKEN_CACHE = TokenCache()
@@ -0,0 +1,128 @@
+"""
+Execution slots of the vendors
+"""
+
+import json
+import time
+from functools import lru_cache
+from typing import Final
+
+from redis.commands.core import Script
+
+from .settings import get_redis
+
+# Sorted set of the held slots of a vendor (score: expiry time)
+EXECUTION_SLOTS_KEY: Final[str] = "inventory-agent:execution-slots:{vendor}"
+# Hash of the job executing in each held slot of a vendor
+EXECUTION_SLOT_JOBS_KEY: Final[str] = "inventory-agent:execution-slots:{vendor}:jobs"
+# A slot is freed after this many seconds even if the completion of its job
+# was lost, so a vendor can not stay blocked forever
+DEFAULT_SLOT_TTL: Final[int] = 6 * 60 * 60
+# A dispatched job not marked as started within this many seconds (the
+# scheduler stopped before starting it) is put back in the pending queue
+DEFAULT_START_TIMEOUT: Final[int] = 5 * 60
+
+
+# Frees the slot holding the job with the given celery task id, if any
+RELEASE_SCRIPT: Final[str] = """
+local jobs = redis.call("HGETALL", KEYS[2])
+for index = 1, #jobs, 2 do
+    if cjson.decode(jobs[index + 1]).job_id == ARGV[1] then
+        redis.call("ZREM", KEYS[1], jobs[index])
+        redis.call("HDEL", KEYS[2], jobs[index])
+        return 1
+    end
+end
+return 0
+"""
+
+# Marks the job of a slot as started and holds the slot for the slot TTL,
+# unless the slot was already released or holds another job
+MARK_STARTED_SCRIPT: Final[str] = """
+local raw_job = redis.call("HGET", KEYS[2], ARGV[1])
+if not raw_job then
+    return 0
+end
+local job = cjson.decode(raw_job)
+if job.job_id ~= ARGV[2] then
+    return 0
+end
+job.started = true
+redis.call("HSET", KEYS[2], ARGV[1], cjson.encode(job))
+redis.call("ZADD", KEYS[1], "XX", ARGV[3], ARGV[1])
+return 1
+"""
+
+
+class ExecutionSlots:
+    """
+    Slots held by a vendor while its jobs are executing, at most the configured
+    number of jobs run at once for a vendor. The dispatch script holds a slot
+    and stores the job in it when taking it from the pending queue, the job is
+    marked as started once it was sent to celery.
+    Dispatch is triggered both by job completion and by the beat, the slots
+    ensure they never start more jobs than there are free slots.
+    """
+
+    @staticmethod
+    def count(vendor: str) -> int:
+        """
+        Number of slots held by the vendor
+        """
+        return get_redis().zcount(
+            EXECUTION_SLOTS_KEY.format(vendor=vendor), time.time(), "+inf"
+        )
+
+    @staticmethod
+    def get_all(vendor: str) -> dict[str, dict]:
+        """
+        Jobs executing for the vendor, keyed by slot
+        """
+        jobs = get_redis().hgetall(EXECUTION_SLOT_JOBS_KEY.format(vendor=vendor))
+        return {slot.decode(): json.loads(job) for slot, job in jobs.items()}
+
+    @staticmethod
+    def mark_started(vendor: str, slot: str, job_id: str) -> bool:
+        """
+        Mark the job dispatched in the slot as started, returns False when
+        the slot was released in the meantime
+        """
+        started = get_mark_started_script()(
+            keys=[
+                EXECUTION_SLOTS_KEY.format(vendor=vendor),
+                EXECUTION_SLOT_JOBS_KEY.format(vendor=vendor),
+            ],
+            args=[slot, job_id, time.time() + DEFAULT_SLOT_TTL],
+        )
+        return bool(started)
+
+    @staticmethod
+    def release(vendor: str, job_id: str) -> bool:
+        """
+        Free the slot of a finished job, given by its celery task id,
+        returns False when no slot holds the job (already released or expired)
+        """
+        released = get_release_script()(
+            keys=[
+                EXECUTION_SLOTS_KEY.format(vendor=vendor),
+                EXECUTION_SLOT_JOBS_KEY.format(vendor=vendor),
+            ],
+            args=[job_id],
+        )
+        return bool(released)
+
+
+@lru_cache
+def get_mark_started_script() -> Script:
+    """
+    Get the mark started script, loaded once and then called by its SHA
+    """
+    return get_redis().register_script(MARK_STARTED_SCRIPT)
+
+
+@lru_cache
+def get_release_script() -> Script:
+    """
+    Get the release script, loaded once and then called by its SHA
+    """
+    return get_redis().register_script(RELEASE_SCRIPT)
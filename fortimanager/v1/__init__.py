@@ -3,6 +3,7 @@ Exports
 """
 
 from .fortimanager import SBFortiManagerV1
+from .fortimanager_batch import FortiManagerBatch, FortiManagerBatchItem
 from .fortimanager_adoms_service import (
     add_adom_folder_or_policy_package,
     get_adom_device_groups,
@@ -12,11 +13,14 @@ from .fortimanager_adoms_service import (
     get_adoms,
     get_device,
     modify_adom_devices,
+    queue_adom_devices,
     update_adom_folder_or_policy_package,
 )
 
 __all__ = [
     "SBFortiManagerV1",
+    "FortiManagerBatch",
+    "FortiManagerBatchItem",
     "get_adoms",
     "get_adom_devices",
     "get_adom_device_groups",
@@ -25,5 +29,6 @@ __all__ = [
     "add_adom_folder_or_policy_package",
     "get_device",
     "modify_adom_devices",
+    "queue_adom_devices",
     "update_adom_folder_or_policy_package",
 ]
@@ -11,6 +11,7 @@ from common.southbound.fortimanager.v1.models.fortimanager_dns import (
 )
 
 from .fortimanager import SBFortiManagerV1
+from .fortimanager_batch import FortiManagerBatch, FortiManagerBatchItem
 from .models.fortimanager_requests import (
     FortiManagerAPIRequestParameterV1,
     FortiManagerAPIRequestParameterV1NoData,
@@ -26,9 +27,7 @@ def get_device_global_system_dns(
     Get FortiManager device system dns info
     """
 
-    request_parameter = FortiManagerAPIRequestParameterV1NoData(
-        url=f"/pm/config/device/{device_name}/global/system/dns"
-    )
+    request_parameter = _device_global_system_dns_parameter(device_name)
 
     request = FortiManagerAPIRequestV1(method="get", params=[request_parameter])
     response = client.post_api(request=request)
@@ -36,6 +35,30 @@ def get_device_global_system_dns(
     return evaluate_model(FortiManagerDeviceSystemDnsV1, response)
 
 
+def queue_device_global_system_dns(
+    batch: FortiManagerBatch,
+    device_name: str,
+) -> FortiManagerBatchItem[FortiManagerDeviceSystemDnsV1]:
+    """
+    Queue a get of FortiManager device system dns info on a "get" batch
+    """
+    return batch.add(
+        _device_global_system_dns_parameter(device_name),
+        FortiManagerDeviceSystemDnsV1,
+    )
+
+
+def _device_global_system_dns_parameter(
+    device_name: str,
+) -> FortiManagerAPIRequestParameterV1NoData:
+    """
+    Request parameter for the device global system dns
+    """
+    return FortiManagerAPIRequestParameterV1NoData(
+        url=f"/pm/config/device/{device_name}/global/system/dns"
+    )
+
+
 def update_device_global_system_dns(
     client: SBFortiManagerV1,
     device_name: str,
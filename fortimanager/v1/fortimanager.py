@@ -2,12 +2,15 @@
 Southbound FortiManager V1 Client
 """
 
+import threading
+
 import httpx
 
 from common.errors import ErrorMessage
 from common.southbound.fortimanager.v1.models.fortimanager_msp import FortiManagerMSPV1
 from common.tools.tmf_logger import TMFLogger
 
+from .fortimanager_batch import DEFAULT_MAX_BATCH_SIZE, FortiManagerBatch
 from .messages import SBFortiManagerV1Messages as Messages
 from .models.fortimanager_requests import (
     FortiManagerAPIRequestParameterV1,
@@ -17,6 +20,11 @@ from .models.fortimanager_requests import (
 
 logger = TMFLogger()
 
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
 
 class SBFortiManagerV1:
     """
@@ -28,7 +36,7 @@ class SBFortiManagerV1:
     LOGIN_ERROR_STATUS_CODE: int = -22
     LOGIN_ENDPOINT: str = "/sys/login/user"
 
-    session_token: str | None = None
+    session_token: str | None
     msp: FortiManagerMSPV1 | None = None
 
     def __init__(
@@ -37,10 +45,14 @@ class SBFortiManagerV1:
         username: str,
         password: str,
         verify_ssl: bool = True,
+        timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
     ):
         """
         SBFortiManagerV1 Constructor
         Example for host (str): "https://<url>/" or "https://<url>"
+        The session token and the pooled httpx.Client are owned by the instance
+        and can be shared by several threads.
         """
 
         self.host = host
@@ -48,6 +60,20 @@ class SBFortiManagerV1:
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.limits = limits
+        self.session_token = None
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._login_lock = threading.Lock()
+
+    def __enter__(self):
+        """Use the client as a context manager"""
+        return self
+
+    def __exit__(self, *_):
+        """Release pooled connections on exit"""
+        self.close()
 
     def __str__(self):
         """Override string representation"""
@@ -57,6 +83,27 @@ class SBFortiManagerV1:
         """Override repr string representation (used by str(list[SBFortiManagerV1])"""
         return self.__str__()
 
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Persistent pooled HTTP client, (re)created lazily after close()
+        """
+        with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    verify=self.verify_ssl, timeout=self.timeout, limits=self.limits
+                )
+            return self._client
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections
+        """
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def post_api(
         self,
         request: FortiManagerAPIRequestV1,
@@ -66,16 +113,9 @@ class SBFortiManagerV1:
         """
         Send the FortiManager API Request
         """
-        if self.session_token is None:
-            self.get_new_session_token()
-
-        request.session = self.session_token or None
+        request.session = self.ensure_session_token()
 
-        response = httpx.post(
-            url=self.host + self.base_path,
-            json=request.dict(exclude_none=True, by_alias=True),
-            verify=self.verify_ssl,
-        ).json()
+        response = self._send(request)
 
         status_code = response["result"][0]["status"]["code"]
 
@@ -86,7 +126,7 @@ class SBFortiManagerV1:
                 return response
             case self.AUTHENTICATION_ERROR_STATUS_CODE:
                 if is_first_auth_call:
-                    self.get_new_session_token()
+                    self.refresh_session_token(request.session)
                     return self.post_api(request, is_first_auth_call=False)
 
                 logger.log(
@@ -106,6 +146,55 @@ class SBFortiManagerV1:
                 message = self.get_error_message(status_code, response)
                 raise httpx.HTTPError(message)
 
+    def post_api_batch(
+        self,
+        request: FortiManagerAPIRequestV1,
+        is_first_auth_call=True,
+    ) -> list[dict]:
+        """
+        Send a multi-parameter FortiManager API Request and return the raw
+        `result` list, one entry per request parameter and in the same order.
+        Per-entry errors are left to the caller.
+        """
+        request.session = self.ensure_session_token()
+
+        results: list[dict] = self._send(request).get("result") or []
+
+        if any(
+            (result.get("status") or {}).get("code")
+            == self.AUTHENTICATION_ERROR_STATUS_CODE
+            for result in results
+        ):
+            if is_first_auth_call:
+                self.refresh_session_token(request.session)
+                return self.post_api_batch(request, is_first_auth_call=False)
+
+            logger.log(
+                Messages.LOGIN_ERROR,
+                code=self.AUTHENTICATION_ERROR_STATUS_CODE,
+                message=results,
+            )
+            raise httpx.HTTPError("FortiManager API Request Login Failed")
+
+        return results
+
+    def batch(
+        self, method: str = "get", max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    ) -> FortiManagerBatch:
+        """
+        Create a batch collecting requests of `method` into multi-parameter calls
+        """
+        return FortiManagerBatch(self, method=method, max_batch_size=max_batch_size)
+
+    def _send(self, request: FortiManagerAPIRequestV1) -> dict:
+        """
+        POST a JSON-RPC request to FortiManager
+        """
+        return self.client.post(
+            url=self.host + self.base_path,
+            json=request.dict(exclude_none=True, by_alias=True),
+        ).json()
+
     def get_error_message(self, status_code, response):
         """
         Raises an HTTPError with the response message
@@ -122,6 +211,28 @@ class SBFortiManagerV1:
 
         return message
 
+    def ensure_session_token(self) -> str | None:
+        """
+        Return the current session token, logging in first if there is none.
+        Concurrent callers wait for a single login and reuse its token.
+        """
+        if self.session_token is None:
+            with self._login_lock:
+                if self.session_token is None:
+                    self.get_new_session_token()
+        return self.session_token or None
+
+    def refresh_session_token(self, stale_token: str | None) -> str | None:
+        """
+        Replace a session token rejected by FortiManager (single-flight).
+        Only the first caller holding `stale_token` logs in again, callers
+        arriving after the refresh reuse the new token.
+        """
+        with self._login_lock:
+            if self.session_token is None or self.session_token == stale_token:
+                self.get_new_session_token()
+        return self.session_token or None
+
     def get_new_session_token(self) -> None:
         """
         Get new session token creating a new
@@ -137,10 +248,9 @@ class SBFortiManagerV1:
             ],
         )
 
-        response = httpx.post(
+        response = self.client.post(
             url=self.host + self.base_path,
             json=login_request.dict(exclude_none=True),
-            verify=self.verify_ssl,
         ).json()
 
         if (session := response.get("session")) is not None:
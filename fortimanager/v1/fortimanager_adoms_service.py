@@ -13,6 +13,7 @@ from common.southbound.fortimanager.v1.models.policy_package import (
 )
 
 from .fortimanager import SBFortiManagerV1
+from .fortimanager_batch import FortiManagerBatch, FortiManagerBatchItem
 from .models.fortimanager_adom import (
     CreateFortiManagerADOMV1,
     FortiManagerADOMV1,
@@ -80,6 +81,25 @@ def get_adom_devices(
     API: POST "/dvmdb/adom/{adom_name}/device"
     """
 
+    request_parameter = _adom_devices_parameter(adom_name)
+    request = FortiManagerAPIRequestV1(method="get", params=[request_parameter])
+    response = client.post_api(request)
+    return evaluate_model(list[FortiManagerDeviceV1], response)
+
+
+def queue_adom_devices(
+    batch: FortiManagerBatch, adom_name: str
+) -> FortiManagerBatchItem[list[FortiManagerDeviceV1]]:
+    """
+    Queue a get of FortiManager Devices by ADOM name on a "get" batch
+    """
+    return batch.add(_adom_devices_parameter(adom_name), list[FortiManagerDeviceV1])
+
+
+def _adom_devices_parameter(adom_name: str) -> FortiManagerAPIRequestParameterV1NoData:
+    """
+    Request parameter for the FortiManager Devices of an ADOM
+    """
     meta_fields = [
         VF_3C_REF,
         ADDRESS,
@@ -87,12 +107,9 @@ def get_adom_devices(
         CONTACT_PHONE_NUMBER,
         VF_ORDER_REF,
     ]
-    request_parameter = FortiManagerAPIRequestParameterV1NoData(
+    return FortiManagerAPIRequestParameterV1NoData(
         url=f"/dvmdb/adom/{adom_name}/device", meta_fields=meta_fields
     )
-    request = FortiManagerAPIRequestV1(method="get", params=[request_parameter])
-    response = client.post_api(request)
-    return evaluate_model(list[FortiManagerDeviceV1], response)
 
 
 def get_device(
@@ -0,0 +1,185 @@
+"""
+FortiManager JSON-RPC batching
+Collects several request parameters of the same method into a single
+JSON-RPC call and demultiplexes `result[i]` back into typed models.
+"""
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import httpx
+
+from common.parsing import evaluate_model
+from common.tools.tmf_logger import TMFLogger
+
+from .messages import SBFortiManagerV1Messages as Messages
+from .models.fortimanager_requests import (
+    FortiManagerAPIRequestParameterV1Base,
+    FortiManagerAPIRequestV1,
+)
+
+if TYPE_CHECKING:
+    from .fortimanager import SBFortiManagerV1
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BATCH_SIZE: int = 50
+
+logger = TMFLogger()
+
+
+class FortiManagerBatchItem(Generic[T]):
+    """
+    Deferred result of a single parameter sent inside a FortiManagerBatch
+    """
+
+    def __init__(
+        self,
+        parameter: FortiManagerAPIRequestParameterV1Base,
+        response_model: type[T],
+    ):
+        self.parameter = parameter
+        self.response_model = response_model
+        self.done: bool = False
+        self.error: httpx.HTTPError | None = None
+        self._data: list | dict | None = None
+
+    def __repr__(self):
+        """Override repr string representation"""
+        return (
+            f"FortiManagerBatchItem(url={self.parameter.url}, done={self.done}, "
+            f"error={self.error!r})"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """True once flushed without a FortiManager error"""
+        return self.done and self.error is None
+
+    def set_data(self, data: list | dict | None) -> None:
+        """Store the `data` of a successful result entry"""
+        self._data = data
+        self.done = True
+
+    def set_error(self, error: httpx.HTTPError) -> None:
+        """Store the error of a failed result entry"""
+        self.error = error
+        self.done = True
+
+    def result(self) -> T:
+        """
+        Typed result of this item
+        Raises:
+            `RuntimeError` if the batch has not been flushed yet
+            `httpx.HTTPError` if FortiManager returned an error for this item
+            `pydantic.ValidationError`
+        """
+        if not self.done:
+            raise RuntimeError("FortiManager batch has not been flushed")
+        if self.error is not None:
+            raise self.error
+        return evaluate_model(self.response_model, self._data)
+
+
+class FortiManagerBatch:
+    """
+    Collects FortiManager request parameters and sends them as multi-parameter
+    JSON-RPC requests of at most `max_batch_size` entries.
+
+    Example:
+        with client.batch() as batch:
+            dns = queue_device_global_system_dns(batch, "FGT-1")
+            routes = queue_device_static_routes(batch, "FGT-1", "root")
+        dns.result(), routes.result()
+    """
+
+    def __init__(
+        self,
+        client: "SBFortiManagerV1",
+        method: str = "get",
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+
+        self.client = client
+        self.method = method
+        self.max_batch_size = max_batch_size
+        self.pending: list[FortiManagerBatchItem] = []
+
+    def __enter__(self):
+        """Collect parameters until the context exits"""
+        return self
+
+    def __exit__(self, exc_type, *_):
+        """Send everything collected unless the block raised"""
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self):
+        """Number of items waiting to be flushed"""
+        return len(self.pending)
+
+    def add(
+        self,
+        parameter: FortiManagerAPIRequestParameterV1Base,
+        response_model: type[T],
+    ) -> FortiManagerBatchItem[T]:
+        """
+        Queue a request parameter, flushing automatically when the batch is full
+        """
+        item = FortiManagerBatchItem(parameter, response_model)
+        self.pending.append(item)
+        if len(self.pending) >= self.max_batch_size:
+            self.flush()
+        return item
+
+    def flush(self) -> None:
+        """
+        Send the queued parameters and assign each result entry to its item.
+        Transport errors are recorded on every item of the failed chunk.
+        """
+        while self.pending:
+            chunk = self.pending[: self.max_batch_size]
+            self.pending = self.pending[self.max_batch_size :]
+            request = FortiManagerAPIRequestV1(
+                method=self.method, params=[item.parameter for item in chunk]
+            )
+            try:
+                results = self.client.post_api_batch(request)
+            except httpx.HTTPError as exc:
+                for item in chunk:
+                    item.set_error(exc)
+                continue
+
+            self._assign_results(chunk, results)
+
+    def _assign_results(
+        self, chunk: list[FortiManagerBatchItem], results: list[dict]
+    ) -> None:
+        """
+        Demultiplex result[i] into chunk[i]
+        """
+        for index, item in enumerate(chunk):
+            if index >= len(results):
+                item.set_error(
+                    httpx.HTTPError("FortiManager API Batch Response Is Missing Items")
+                )
+                continue
+
+            result = results[index]
+            status = result.get("status") or {}
+            status_code = status.get("code")
+            if status_code == self.client.OK_STATUS_CODE:
+                item.set_data(result.get("data"))
+            else:
+                logger.log(
+                    Messages.API_REQUEST_FAILED,
+                    code=status_code,
+                    message=result,
+                    url=item.parameter.url,
+                )
+                item.set_error(
+                    httpx.HTTPError(
+                        status.get("message") or "FortiManager API Request Failed"
+                    )
+                )
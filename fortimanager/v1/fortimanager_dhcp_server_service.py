@@ -5,6 +5,10 @@ pm/config/device/{device_name}/vdom/{vdom_name}/system/dhcp/server Endpoint
 
 from common.parsing import evaluate_model
 from common.southbound.fortimanager.v1.fortimanager import SBFortiManagerV1
+from common.southbound.fortimanager.v1.fortimanager_batch import (
+    FortiManagerBatch,
+    FortiManagerBatchItem,
+)
 from common.southbound.fortimanager.v1.models.fortimanager_dhcp_server import (
     CreateFortiManagerDHCPServerV1,
     FortiManagerDHCPServerV1,
@@ -32,14 +36,34 @@ def get_device_dhcp_servers(
     API: GET "/system/dhcp/server"
     """
 
-    request_parameter = FortiManagerAPIRequestParameterV1NoData(
-        url=f"{DEVICE_API}/{device_name}/{ENDPOINT}"
-    )
+    request_parameter = _device_dhcp_servers_parameter(device_name)
     request = FortiManagerAPIRequestV1(method="get", params=[request_parameter])
     response = client.post_api(request)
     return evaluate_model(list[FortiManagerDHCPServerV1], response)
 
 
+def queue_device_dhcp_servers(
+    batch: FortiManagerBatch, device_name: str
+) -> FortiManagerBatchItem[list[FortiManagerDHCPServerV1]]:
+    """
+    Queue a select of all device's DHCP servers entries on a "get" batch
+    """
+    return batch.add(
+        _device_dhcp_servers_parameter(device_name), list[FortiManagerDHCPServerV1]
+    )
+
+
+def _device_dhcp_servers_parameter(
+    device_name: str,
+) -> FortiManagerAPIRequestParameterV1NoData:
+    """
+    Request parameter for the device's DHCP servers
+    """
+    return FortiManagerAPIRequestParameterV1NoData(
+        url=f"{DEVICE_API}/{device_name}/{ENDPOINT}"
+    )
+
+
 def get_device_dhcp_server(
     client: SBFortiManagerV1,
     device_name: str,
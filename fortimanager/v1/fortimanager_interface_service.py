@@ -6,6 +6,10 @@ pm/config/device/{device_name}/global/system/interface Endpoint
 
 from common.parsing import evaluate_model
 from common.southbound.fortimanager.v1.fortimanager import SBFortiManagerV1
+from common.southbound.fortimanager.v1.fortimanager_batch import (
+    FortiManagerBatch,
+    FortiManagerBatchItem,
+)
 from common.southbound.fortimanager.v1.models.fortimanager_interface import (
     FortiManagerCreateVlanInterfaceV1,
     FortiManagerUpdateVlanInterfaceV1,
@@ -30,15 +34,35 @@ def get_vlan_interfaces(
     API: GET "/system/interface"
     """
 
-    request_parameter = FortiManagerAPIRequestParameterV1NoData(
-        url=f"pm/config/device/{device_name}/global/system/interface",
-        filter=["type", "in", "vlan"],
-    )
+    request_parameter = _vlan_interfaces_parameter(device_name)
     request = FortiManagerAPIRequestV1(method="get", params=[request_parameter])
     response = client.post_api(request)
     return evaluate_model(list[FortiManagerVlanInterfaceV1], response)
 
 
+def queue_vlan_interfaces(
+    batch: FortiManagerBatch, device_name: str
+) -> FortiManagerBatchItem[list[FortiManagerVlanInterfaceV1]]:
+    """
+    Queue a select of all device's vlan interfaces on a "get" batch
+    """
+    return batch.add(
+        _vlan_interfaces_parameter(device_name), list[FortiManagerVlanInterfaceV1]
+    )
+
+
+def _vlan_interfaces_parameter(
+    device_name: str,
+) -> FortiManagerAPIRequestParameterV1NoData:
+    """
+    Request parameter for the device's vlan interfaces
+    """
+    return FortiManagerAPIRequestParameterV1NoData(
+        url=f"pm/config/device/{device_name}/global/system/interface",
+        filter=["type", "in", "vlan"],
+    )
+
+
 def get_vlan_interface(
     client: SBFortiManagerV1,
     device_name: str,
@@ -8,6 +8,7 @@ from common.southbound.fortimanager.v1.models.fortimanager_responses import (
 )
 
 from .fortimanager import SBFortiManagerV1
+from .fortimanager_batch import FortiManagerBatch, FortiManagerBatchItem
 from .models.fortimanager_requests import (
     FortiManagerAPIRequestParameterV1,
     FortiManagerAPIRequestParameterV1NoData,
@@ -28,14 +29,34 @@ def get_device_static_routes(
     Select all IPV4 device's static routes entries.
     API: GET "/router/static"
     """
-    request_parameter = FortiManagerAPIRequestParameterV1NoData(
-        url=f"pm/config/device/{device}/vdom/{vdom}/router/static"
-    )
+    request_parameter = _device_static_routes_parameter(device, vdom)
     request = FortiManagerAPIRequestV1(method="get", params=[request_parameter])
     response = client.post_api(request)
     return evaluate_model(list[FortinetStaticRoute], response)
 
 
+def queue_device_static_routes(
+    batch: FortiManagerBatch, device: str, vdom: str
+) -> FortiManagerBatchItem[list[FortinetStaticRoute]]:
+    """
+    Queue a select of all IPV4 device's static routes entries on a "get" batch
+    """
+    return batch.add(
+        _device_static_routes_parameter(device, vdom), list[FortinetStaticRoute]
+    )
+
+
+def _device_static_routes_parameter(
+    device: str, vdom: str
+) -> FortiManagerAPIRequestParameterV1NoData:
+    """
+    Request parameter for the device's IPV4 static routes
+    """
+    return FortiManagerAPIRequestParameterV1NoData(
+        url=f"pm/config/device/{device}/vdom/{vdom}/router/static"
+    )
+
+
 def get_device_static_route(
     client: SBFortiManagerV1, device: str, sequence_number: str
 ) -> FortinetStaticRoute:
@@ -0,0 +1,82 @@
+"""
+Tests for the FortiManager JSON-RPC batching
+"""
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from common.southbound.fortimanager.v1 import fortimanager_batch
+from common.southbound.fortimanager.v1.fortimanager import SBFortiManagerV1
+from common.southbound.fortimanager.v1.models.fortimanager_requests import (
+    FortiManagerAPIRequestParameterV1NoData,
+    FortiManagerAPIRequestV1,
+)
+
+
+def ok_result(data) -> dict:
+    """
+    Successful JSON-RPC result entry
+    """
+    return {"status": {"code": SBFortiManagerV1.OK_STATUS_CODE}, "data": data}
+
+
+def test_flush_mixed_results(mocker: MockerFixture):
+    """
+    Test if result[i] is assigned to the i-th item, failed entries and entries
+    missing from the response raising only on their own item
+    """
+    client = SBFortiManagerV1("https://fmg", "user", "password")
+    post_api_batch = mocker.patch.object(
+        client,
+        "post_api_batch",
+        return_value=[
+            ok_result({"name": "first"}),
+            {"status": {"code": -3, "message": "Object does not exist"}},
+            ok_result({"name": "third"}),
+        ],
+    )
+    log = mocker.patch.object(fortimanager_batch.logger, "log")
+
+    with client.batch() as batch:
+        items = [
+            batch.add(FortiManagerAPIRequestParameterV1NoData(url=f"/url/{i}"), dict)
+            for i in range(4)
+        ]
+
+    post_api_batch.assert_called_once()
+    assert [item.ok for item in items] == [True, False, True, False]
+    assert items[0].result() == {"name": "first"}
+    assert items[2].result() == {"name": "third"}
+    with pytest.raises(httpx.HTTPError, match="Object does not exist"):
+        items[1].result()
+    with pytest.raises(httpx.HTTPError, match="Missing Items"):
+        items[3].result()
+    log.assert_called_once()
+
+
+def test_flush_splits_into_chunks(mocker: MockerFixture):
+    """
+    Test if parameters are sent in chunks of at most `max_batch_size` entries
+    and every chunk's results go to its own items
+    """
+    client = SBFortiManagerV1("https://fmg", "user", "password")
+    requests: list[FortiManagerAPIRequestV1] = []
+
+    def post_api_batch(request: FortiManagerAPIRequestV1) -> list[dict]:
+        requests.append(request)
+        return [ok_result(parameter.url) for parameter in request.params]
+
+    mocker.patch.object(client, "post_api_batch", side_effect=post_api_batch)
+
+    with client.batch(method="get", max_batch_size=2) as batch:
+        items = [
+            batch.add(FortiManagerAPIRequestParameterV1NoData(url=f"/url/{i}"), str)
+            for i in range(5)
+        ]
+        assert len(batch) == 1
+
+    assert len(batch) == 0
+    assert [len(request.params) for request in requests] == [2, 2, 1]
+    assert all(request.method == "get" for request in requests)
+    assert [item.result() for item in items] == [f"/url/{i}" for i in range(5)]
@@ -15,3 +15,7 @@ class MistMessages(TMFMessage):
         LogLevel.ERROR,
         "Unable to create mist client",
     )
+    MAX_PAGES_REACHED = (
+        LogLevel.WARNING,
+        "Stopped reading a paginated endpoint at the maximum number of pages",
+    )
@@ -1,23 +1,78 @@
 """
 Southbound Mist v1 Client
 """
+
+from collections.abc import Iterator
 from typing import TypeVar
 
 import httpx
 
 from common.parsing import evaluate_model
+from common.tools.tmf_logger import TMFLogger
+
+from .messages import MistMessages as Messages
 
 T = TypeVar("T")
 
+logger = TMFLogger()
+
+DEFAULT_PAGE_LIMIT: int = 100
+# Guard against endpoints ignoring the pagination parameters
+DEFAULT_MAX_PAGES: int = 1000
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
 
 class SBMistV1:
     """
     Mist V1 API Operations
     """
 
-    def __init__(self, host: str, api_key: str):
+    def __init__(
+        self,
+        host: str,
+        api_key: str,
+        timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ):
         self.host = host
         self.api_key = api_key
+        self.timeout = timeout
+        self.limits = limits
+        self._client: httpx.Client | None = None
+
+    def __enter__(self):
+        """Use the client as a context manager"""
+        return self
+
+    def __exit__(self, *_):
+        """Release pooled connections on exit"""
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Persistent pooled HTTP client, (re)created lazily after close()
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def headers(self) -> dict[str, str]:
+        """
+        Authentication headers for a Mist request
+        """
+        return {"Authorization": "Token " + self.api_key}
 
     def get_api(self, endpoint, response_model: type[T]) -> T:
         """
@@ -26,7 +81,84 @@ class SBMistV1:
             `httpx.HTTPError`
             `pydantic.ValidationError`
         """
-        headers = {"Authorization": "Token " + self.api_key}
-        response = httpx.get(self.host + endpoint, headers=headers)
+        response = self.client.get(self.host + endpoint, headers=self.headers())
         response.raise_for_status()
         return evaluate_model(response_model, response.json())
+
+    def iter_api_pages(
+        self,
+        endpoint,
+        item_model: type[T],
+        limit: int = DEFAULT_PAGE_LIMIT,
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ) -> Iterator[list[T]]:
+        """
+        Get Request for a paginated Mist API, yielding one validated page at a time.
+        Pages are requested with the `page`/`limit` query parameters until
+        `X-Page-Total` items have been read or a short page is returned.
+        Reading also stops when a page starts with the same item as the previous
+        one (the endpoint ignores `page`) or after `max_pages` pages, the latter
+        is logged as a warning since the remaining items are not read.
+        Raises:
+            `httpx.HTTPError`
+            `pydantic.ValidationError`
+        """
+        previous_first_item = None
+        read = 0
+        for page in range(1, max_pages + 1):
+            response = self.client.get(
+                self.host + endpoint,
+                headers=self.headers(),
+                params={"page": page, "limit": limit},
+            )
+            response.raise_for_status()
+            raw_items = response.json()
+            if raw_items and raw_items[0] == previous_first_item:
+                return
+            previous_first_item = raw_items[0] if raw_items else None
+
+            items: list[T] = evaluate_model(list[item_model], raw_items)
+            if items:
+                yield items
+
+            read += len(items)
+            page_limit = _int_header(response, "X-Page-Limit") or limit
+            page_total = _int_header(response, "X-Page-Total")
+            if page_total is not None:
+                if read >= page_total or not items:
+                    return
+            elif len(items) < page_limit:
+                return
+        else:
+            logger.log(
+                Messages.MAX_PAGES_REACHED, endpoint=endpoint, max_pages=max_pages
+            )
+
+    def get_api_paginated(
+        self,
+        endpoint,
+        item_model: type[T],
+        limit: int = DEFAULT_PAGE_LIMIT,
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ) -> list[T]:
+        """
+        Get Request for a paginated Mist API, returning the items of every page
+        Raises:
+            `httpx.HTTPError`
+            `pydantic.ValidationError`
+        """
+        return [
+            item
+            for items in self.iter_api_pages(endpoint, item_model, limit, max_pages)
+            for item in items
+        ]
+
+
+def _int_header(response: httpx.Response, name: str) -> int | None:
+    """
+    Integer value of a response header, None if missing or invalid
+    """
+    try:
+        return int(response.headers[name])
+    except (KeyError, ValueError):
+        return None
@@ -9,13 +9,13 @@ def get_msp_site_device_stats(
     client: SBMistV1, site_id: str, device_type: str = "all", status: str = "all"
 ) -> list[MistDeviceStatsV1]:
     """
-    API: GET /sites/:site_id/stats/devices
+    API: GET /sites/:site_id/stats/devices (paginated)
     Raises:
         `httpx.HTTPError`
         `pydantic.ValidationError`
     """
     url = f"/sites/{site_id}/stats/devices?type={device_type}&status={status}"
-    return client.get_api(url, list[MistDeviceStatsV1])
+    return client.get_api_paginated(url, MistDeviceStatsV1)
 
 
 def get_msp_device_stats(
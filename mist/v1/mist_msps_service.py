@@ -18,12 +18,12 @@ def get_msp_info(client: SBMistV1, msp_id: str) -> MistMSPV1:
 
 def get_msp_orgs(client: SBMistV1, msp_id: str) -> list[MistOrganizationV1]:
     """
-    API: /msps/{msp_id}/orgs
+    API: /msps/{msp_id}/orgs (paginated)
     Raises:
         `httpx.HTTPError`
         `pydantic.ValidationError`
     """
-    return client.get_api(f"/msps/{msp_id}/orgs", list[MistOrganizationV1])
+    return client.get_api_paginated(f"/msps/{msp_id}/orgs", MistOrganizationV1)
 
 
 def get_msp_org_groups(client: SBMistV1, msp_id: str) -> list[MistOrganizationGroupV1]:
@@ -7,9 +7,9 @@ from .models import MistSiteV1
 
 def get_mist_organization_sites(client: SBMistV1, org_id: str) -> list[MistSiteV1]:
     """
-    API: /orgs/{{org_id}}/sites
+    API: /orgs/{{org_id}}/sites (paginated)
     Raises:
         `httpx.HTTPError`
         `pydantic.ValidationError`
     """
-    return client.get_api(f"/orgs/{org_id}/sites", list[MistSiteV1])
+    return client.get_api_paginated(f"/orgs/{org_id}/sites", MistSiteV1)
@@ -0,0 +1,61 @@
+"""
+Tests for the Mist v1 client
+"""
+
+import httpx
+
+from common.southbound.mist.v1 import mist
+from common.southbound.mist.v1.messages import MistMessages
+from common.southbound.mist.v1.mist import SBMistV1
+
+HOST = "https://mist"
+
+
+def test_iter_api_pages_max_pages_reached(monkeypatch):
+    """
+    Test if reading stops after `max_pages` full pages and the truncation
+    is logged as a warning
+    """
+    requested_pages = []
+    logged = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        requested_pages.append(page)
+        return httpx.Response(200, json=[page * 10, page * 10 + 1])
+
+    monkeypatch.setattr(
+        mist.logger, "log", lambda message, **kwargs: logged.append((message, kwargs))
+    )
+    client = SBMistV1(HOST, "key")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    pages = list(client.iter_api_pages("/items", int, limit=2, max_pages=3))
+
+    assert pages == [[10, 11], [20, 21], [30, 31]]
+    assert requested_pages == [1, 2, 3]
+    assert logged == [
+        (MistMessages.MAX_PAGES_REACHED, {"endpoint": "/items", "max_pages": 3})
+    ]
+
+
+def test_iter_api_pages_short_page_not_logged(monkeypatch):
+    """
+    Test if a short last page ends reading without a warning
+    """
+    logged = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=[1, 2] if page == 1 else [3])
+
+    monkeypatch.setattr(
+        mist.logger, "log", lambda message, **kwargs: logged.append((message, kwargs))
+    )
+    client = SBMistV1(HOST, "key")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    pages = list(client.iter_api_pages("/items", int, limit=2, max_pages=3))
+
+    assert pages == [[1, 2], [3]]
+    assert not logged
@@ -0,0 +1,191 @@
+"""
+Index of the job names in the pending queue
+"""
+
+import math
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Final
+
+from redis.commands.core import Script
+
+from .redis.util import PENDING_JOBS_KEY, PendingJob
+from .settings import get_redis
+
+PENDING_JOB_NAMES_KEY: Final[str] = "inventory-agent:pending-jobs:names"
+PENDING_VENDOR_JOB_NAMES_KEY: Final[str] = "inventory-agent:pending-jobs:{vendor}:names"
+# Claims older than this are checked against the pending queue on the next
+# enqueue of their name, so a job lost from the pending queue without being
+# released can not block its name forever
+DEFAULT_CLAIM_MAX_AGE: Final[int] = 24 * 60 * 60
+
+
+# Lua function giving the seconds since the epoch of an ISO 8601 job date,
+# dates without an offset are in the scheduler local time, `utc_offset`
+# seconds ahead of UTC
+RECEIVE_TIME_FUNCTION: Final[str] = """
+local function receive_time(date, utc_offset)
+    if type(date) ~= "string" then
+        return nil
+    end
+    local year, month, day, hour, minute, second = string.match(
+        date, "^(%d+)-(%d+)-(%d+)[T ](%d+):(%d+):(%d+%.?%d*)"
+    )
+    if not year then
+        return nil
+    end
+    year, month = tonumber(year), tonumber(month)
+    if month <= 2 then
+        year, month = year - 1, month + 9
+    else
+        month = month - 3
+    end
+    local era = math.floor(year / 400)
+    local year_of_era = year - era * 400
+    local day_of_era = year_of_era * 365 + math.floor(year_of_era / 4)
+        - math.floor(year_of_era / 100)
+        + math.floor((153 * month + 2) / 5) + tonumber(day) - 1
+    local days = era * 146097 + day_of_era - 719468
+    local sign, offset_hour, offset_minute = string.match(
+        date, "([+-])(%d%d):?(%d%d)$"
+    )
+    if sign then
+        utc_offset = (tonumber(offset_hour) * 3600 + tonumber(offset_minute) * 60)
+            * (sign == "-" and -1 or 1)
+    elseif string.sub(date, -1) == "Z" then
+        utc_offset = 0
+    end
+    return days * 86400 + tonumber(hour) * 3600 + tonumber(minute) * 60
+        + tonumber(second) - utc_offset
+end
+"""
+
+# Claims the job name in the index and in the index of its vendor (scored by
+# the job receive time) and appends
+# the job to the pending queue in one atomic step. When the index is missing it
+# is first rebuilt from the pending queue, which is empty in the steady state
+# (the index only disappears once every pending job was dispatched).
+# A claim older than the max age is kept (and renewed) only while its job is
+# still in the pending queue.
+ENQUEUE_SCRIPT: Final[str] = RECEIVE_TIME_FUNCTION + """
+local now = tonumber(ARGV[3])
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    for _, raw_job in ipairs(redis.call("LRANGE", KEYS[2], 0, -1)) do
+        local job = cjson.decode(raw_job)
+        local vendor_key = string.gsub(ARGV[5], "{vendor}", job.job_queue)
+        redis.call("ZADD", KEYS[1], "NX", now, job.name)
+        redis.call(
+            "ZADD",
+            vendor_key,
+            "NX",
+            receive_time(job.jobReceiveDate, tonumber(ARGV[6])) or now,
+            job.name
+        )
+    end
+end
+local claimed = tonumber(redis.call("ZSCORE", KEYS[1], ARGV[1]))
+if claimed then
+    if claimed > now - tonumber(ARGV[4]) then
+        return 0
+    end
+    for _, raw_job in ipairs(redis.call("LRANGE", KEYS[2], 0, -1)) do
+        if cjson.decode(raw_job).name == ARGV[1] then
+            redis.call("ZADD", KEYS[1], now, ARGV[1])
+            return 0
+        end
+    end
+end
+redis.call("ZADD", KEYS[1], now, ARGV[1])
+redis.call("ZADD", KEYS[3], ARGV[7], ARGV[1])
+redis.call("RPUSH", KEYS[2], ARGV[2])
+return 1
+"""
+
+
+class PendingJobIndex:
+    """
+    Redis sorted sets of the job names in the pending queue, overall
+    (score: claim time) and per vendor (score: job receive time).
+    Claiming a name and enqueuing its job is a single atomic script call,
+    so concurrent beat ticks can not enqueue the same job twice. Names are
+    released when the job leaves the pending queue.
+    """
+
+    @staticmethod
+    def enqueue(job: PendingJob, max_age: int = DEFAULT_CLAIM_MAX_AGE) -> bool:
+        """
+        Add the job to the pending queue, returns False when a job with
+        the same name is already pending
+        """
+        added = get_enqueue_script()(
+            keys=[
+                PENDING_JOB_NAMES_KEY,
+                PENDING_JOBS_KEY,
+                PENDING_VENDOR_JOB_NAMES_KEY.format(vendor=job.job_queue),
+            ],
+            args=[
+                job.name,
+                job.json(),
+                time.time(),
+                max_age,
+                PENDING_VENDOR_JOB_NAMES_KEY,
+                local_utc_offset(),
+                job.jobReceiveDate.timestamp(),
+            ],
+        )
+        return bool(added)
+
+    @staticmethod
+    def release(name: str, vendor: str) -> None:
+        """
+        Release a job name once the job left the pending queue
+        """
+        pipeline = get_redis().pipeline()
+        pipeline.zrem(PENDING_JOB_NAMES_KEY, name)
+        pipeline.zrem(PENDING_VENDOR_JOB_NAMES_KEY.format(vendor=vendor), name)
+        pipeline.execute()
+
+    @staticmethod
+    def oldest_receive_times(vendors: Sequence[str]) -> dict[str, float]:
+        """
+        Receive time of the oldest pending job of each vendor, infinite when
+        the vendor has none. One round trip, O(log n) per vendor.
+        """
+        pipeline = get_redis().pipeline()
+        for vendor in vendors:
+            pipeline.zrange(
+                PENDING_VENDOR_JOB_NAMES_KEY.format(vendor=vendor),
+                0,
+                0,
+                withscores=True,
+            )
+        oldest = pipeline.execute()
+        return {
+            vendor: jobs[0][1] if jobs else math.inf
+            for vendor, jobs in zip(vendors, oldest)
+        }
+
+    @staticmethod
+    def count() -> int:
+        """
+        Number of pending job names
+        """
+        return get_redis().zcard(PENDING_JOB_NAMES_KEY)
+
+
+def local_utc_offset() -> float:
+    """
+    Seconds the scheduler local time is ahead of UTC, for the job dates
+    stored without an offset
+    """
+    return datetime.now().astimezone().utcoffset().total_seconds()
+
+
+@lru_cache
+def get_enqueue_script() -> Script:
+    """
+    Get the enqueue script, loaded once and then called by its SHA
+    """
+    return get_redis().register_script(ENQUEUE_SCRIPT)
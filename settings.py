@@ -5,7 +5,8 @@ Inventory Agent Config Model
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import parse_obj_as
+from pydantic import BaseModel, PositiveInt, parse_obj_as
+from redis import Redis
 
 from common.config import ConfigLoader
 from common.database.redis import RedisDB
@@ -22,6 +23,7 @@ from common.models.settings import (
 )
 from common.resources import ResourceType
 from common.southbound.cisco_meraki import SBMeraki
+from common.southbound.cisco_meraki.rate_limiter import MerakiRateLimiter
 from common.southbound.fortimanager.v1.fortimanager import SBFortiManagerV1
 from common.southbound.mist.v1.mist import SBMistV1
 from common.southbound.velocloud import SBVelocloudV1, v1
@@ -30,10 +32,36 @@ from common.tools import TMFLogger
 from .messages import ConfigMessages as Messages
 
 VENDORS = ("MIST", "MERAKI", "VELOCLOUD", "FORTIMANAGER")
+DEFAULT_AGING_INTERVAL = 15 * 60
+
+
+class DispatchSettings(BaseModel):
+    """
+    Scheduler dispatch policy settings.
+    Task weights default to 1, a pending job's weight grows by its own value
+    every `aging_interval` seconds it waits.
+    Vendors run up to `vendor_slots` jobs at once (1 by default), with
+    `shard_slots` runs of the same task never overlap.
+    """
+
+    policy: Literal["fifo", "fair_share"] = "fair_share"
+    task_weights: dict[str, float] = {}
+    aging_interval: float = DEFAULT_AGING_INTERVAL
+    vendor_slots: dict[str, PositiveInt] = {}
+    shard_slots: bool = False
+
+
+class ConfigDispatchSettings(BaseModel):
+    """Scheduler Dispatch Config Settings"""
+
+    dispatch: DispatchSettings = DispatchSettings()
 
 
 class InventoryAgentSettings(
-    ConfigCelerySettings, ConfigTMFServicesSettings, ConfigSchedulerSettings
+    ConfigCelerySettings,
+    ConfigTMFServicesSettings,
+    ConfigSchedulerSettings,
+    ConfigDispatchSettings,
 ):
     """Inventory Agent Config Settings"""
 
@@ -104,6 +132,14 @@ def get_scheduler_settings():
     return ConfigSchedulerSettings(**get_config().config).sync_wave_scheduler.crontab
 
 
+@lru_cache
+def get_dispatch_settings() -> DispatchSettings:
+    """
+    Get the scheduler dispatch policy settings
+    """
+    return ConfigDispatchSettings(**get_config().config).dispatch
+
+
 @lru_cache
 def get_enabled_vendors() -> (
     tuple[Literal["MIST", "MERAKI", "VELOCLOUD", "FORTIMANAGER"], ...]
@@ -124,6 +160,14 @@ def get_redis_broker():
     return RedisDB(uri=get_celery_settings().broker)
 
 
+@lru_cache
+def get_redis() -> Redis:
+    """
+    Get the client of the redis broker
+    """
+    return get_redis_broker().connect()
+
+
 @lru_cache
 def get_velocloud() -> tuple[list[SBVelocloudV1], list[VelocloudConfigMap]]:
     """
@@ -184,7 +228,19 @@ def get_meraki() -> SBMeraki:
     """
     meraki_config = get_meraki_config()
     TMFLogger().log(Messages.MERAKI_CONFIGURED, population=meraki_config.populate)
-    return SBMeraki(meraki_config.endpoint, meraki_config.token)
+    return SBMeraki(
+        meraki_config.endpoint,
+        meraki_config.token,
+        rate_limiter=get_meraki_rate_limiter(),
+    )
+
+
+@lru_cache
+def get_meraki_rate_limiter() -> MerakiRateLimiter:
+    """
+    Get the Meraki rate limiter shared by all workers through the redis broker
+    """
+    return MerakiRateLimiter(get_redis())
 
 
 @lru_cache
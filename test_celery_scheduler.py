@@ -2,6 +2,7 @@
 Tests for generic celery scheduler functionality
 """
 
+from datetime import datetime, timedelta
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock, call, patch
 
@@ -10,15 +11,27 @@ from celery import Task
 from pytest_mock import MockerFixture
 
 from common.models.enums import Vendors
+from inventory_agent import dispatch_policy
 from inventory_agent.celery_scheduler import (
     common_run_scheduler_by_vendor,
     common_scheduler_insert_into_buffer,
     enable_scheduled_tasks_by_vendor,
     start_scheduled_tasks_controller,
+    update_scheduler_entity_status,
 )
+from inventory_agent.dispatch_policy import (
+    DispatchWaitStats,
+    FifoDispatchPolicy,
+    WeightedFairSharePolicy,
+    get_dropped_jobs,
+)
+from inventory_agent.execution_slots import ExecutionSlots
+from inventory_agent.models import TaskStatus
 from inventory_agent.models.disable_initial_population import DisableInitialPopulation
+from inventory_agent.pending_index import PendingJobIndex
 from inventory_agent.redis.util import (
     ExecutingQueue,
+    PendingJob,
     PendingQueue,
     celery_queue_length,
     get_disable_initial_population,
@@ -100,6 +113,249 @@ class TestScheduledTasks:
         assert len(PendingQueue.get_all()) == 2
         assert PendingQueue.get_first().name == "foo"
 
+    def test_common_scheduler_insert_into_buffer_until_released(self):
+        """
+        Tests if a task name can only be inserted again once it left the pending queue
+        """
+        common_scheduler_insert_into_buffer("foo", "BAR")
+        common_scheduler_insert_into_buffer("foo", "BAR")
+
+        assert len(PendingQueue.get_all()) == 1
+        assert PendingJobIndex.count() == 1
+
+        PendingQueue.remove_first_by_vendor("BAR")
+        PendingJobIndex.release("foo", "BAR")
+        common_scheduler_insert_into_buffer("foo", "BAR")
+
+        assert len(PendingQueue.get_all()) == 1
+        assert PendingJobIndex.count() == 1
+
+    def test_pending_job_index_keeps_old_claims_of_pending_jobs(self):
+        """
+        Tests if an old claim still blocks its name while the job is pending,
+        and is taken over once the job was lost from the pending queue
+        """
+        job = PendingJob(name="foo", job_queue="BAR", jobReceiveDate=datetime.now())
+
+        assert PendingJobIndex.enqueue(job) is True
+        assert PendingJobIndex.enqueue(job, max_age=0) is False
+        assert len(PendingQueue.get_all()) == 1
+
+        PendingQueue.remove_first_by_vendor("BAR")
+
+        assert PendingJobIndex.enqueue(job, max_age=0) is True
+        assert len(PendingQueue.get_all()) == 1
+
+    def test_weighted_fair_share_policy(self):
+        """
+        Tests if pending jobs are dispatched in proportion to their task weight
+        """
+        policy = WeightedFairSharePolicy(task_weights={"foo": 3})
+        dispatched = []
+        for _ in range(8):
+            for name in ("foo", "bar"):
+                if name not in [job.name for job in PendingQueue.get_all()]:
+                    PendingQueue.add(name=name, job_queue="BAR")
+            dispatch = policy.pop("BAR", 5, "job-id")
+            ExecutionSlots.release("BAR", "job-id")
+            dispatched.append(dispatch.job.name)
+
+        assert dispatched.count("foo") == 6
+        assert dispatched.count("bar") == 2
+        assert DispatchWaitStats.by_vendor()["BAR"].count == 8
+        assert policy.pop("ANYTHING", 5, "job-id") is None
+
+    def test_weighted_fair_share_policy_order_vendors(self):
+        """
+        Tests if vendors are dispatched by the age of their oldest pending job
+        """
+        common_scheduler_insert_into_buffer("foo", "BAR")
+        common_scheduler_insert_into_buffer("bar", "FOO")
+        common_scheduler_insert_into_buffer("baz", "BAR")
+        policy = WeightedFairSharePolicy()
+
+        assert policy.order_vendors(["FOO", "BAZ", "BAR"]) == ["BAR", "FOO", "BAZ"]
+
+        policy.pop("BAR", 5, "job-id")
+
+        assert policy.order_vendors(["FOO", "BAZ", "BAR"]) == ["FOO", "BAR", "BAZ"]
+
+    def test_weighted_fair_share_policy_ages_from_receive_date(self):
+        """
+        Tests if the wait of a job and the order of its vendor are measured
+        from its receive date, not from when its name was claimed
+        """
+        common_scheduler_insert_into_buffer("foo", "FOO")
+        PendingJobIndex.enqueue(
+            PendingJob(
+                name="bar",
+                job_queue="BAR",
+                jobReceiveDate=datetime.now() - timedelta(days=2),
+            )
+        )
+        policy = WeightedFairSharePolicy(task_weights={})
+
+        assert policy.order_vendors(["FOO", "BAR"]) == ["BAR", "FOO"]
+        assert policy.pop("BAR", 5, "job-id").wait_time >= 2 * 24 * 60 * 60
+
+    def test_dispatch_policy_pop_holds_execution_slots(self):
+        """
+        Tests if vendor jobs are only dispatched while the vendor has free slots
+        """
+        for name in ("foo", "bar", "baz"):
+            PendingQueue.add(name=name, job_queue="BAR")
+        policy = FifoDispatchPolicy(vendor_slots={"BAR": 2})
+
+        first = policy.pop("BAR", 5, "job-1")
+        second = policy.pop("BAR", 5, "job-2")
+
+        assert (first.job.name, first.job.slot, first.free_slots) == ("foo", "1", 1)
+        assert (second.job.name, second.job.slot, second.free_slots) == ("bar", "2", 0)
+        assert policy.pop("BAR", 5, "job-3") is None
+        assert ExecutionSlots.count("BAR") == 2
+
+        ExecutionSlots.release("BAR", "job-1")
+        third = policy.pop("BAR", 5, "job-3")
+
+        assert (third.job.name, third.job.slot, third.job.job_id) == (
+            "baz",
+            "1",
+            "job-3",
+        )
+        assert PendingQueue.exists_by_vendor("BAR") is False
+
+    def test_dispatch_policy_pop_sharded_execution_slots(self):
+        """
+        Tests if jobs of the same task never run at the same time
+        """
+        PendingQueue.add(name="foo", job_queue="BAR")
+        policy = FifoDispatchPolicy(vendor_slots={"BAR": 2}, shard_slots=True)
+        assert policy.pop("BAR", 5, "job-1").job.slot == "foo"
+
+        PendingQueue.add(name="foo", job_queue="BAR")
+        PendingQueue.add(name="bar", job_queue="BAR")
+
+        assert policy.pop("BAR", 5, "job-2").job.slot == "bar"
+        assert policy.pop("BAR", 5, "job-3") is None
+
+    def test_dispatch_policy_pop_requeues_at_the_head(self, mocker):
+        """
+        Tests if an expired unstarted job is put back before the jobs
+        enqueued after it, or dropped and counted when a job with the same
+        name is pending again
+        """
+        for name in ("foo", "bar"):
+            common_scheduler_insert_into_buffer(name, "BAR")
+        policy = FifoDispatchPolicy()
+        mocker.patch.object(dispatch_policy, "DEFAULT_START_TIMEOUT", -1)
+        policy.pop("BAR", 5, "job-1")
+
+        assert policy.pop("BAR", 0, "job-2") is None
+        assert [job.name for job in PendingQueue.get_all()] == ["foo", "bar"]
+        assert get_dropped_jobs() == {}
+
+        policy.pop("BAR", 5, "job-3")
+        common_scheduler_insert_into_buffer("foo", "BAR")
+
+        assert policy.pop("BAR", 0, "job-4") is None
+        assert [job.name for job in PendingQueue.get_all()] == ["bar", "foo"]
+        assert get_dropped_jobs() == {"BAR:foo": 1}
+
+    def test_execution_slots_release_by_job_id(self):
+        """
+        Tests if only the slot holding the finished job is freed
+        """
+        for name in ("foo", "bar"):
+            PendingQueue.add(name=name, job_queue="BAR")
+        policy = FifoDispatchPolicy(vendor_slots={"BAR": 2})
+        policy.pop("BAR", 5, "job-1")
+        policy.pop("BAR", 5, "job-2")
+
+        assert ExecutionSlots.release("BAR", "job-3") is False
+        assert ExecutionSlots.count("BAR") == 2
+        assert ExecutionSlots.release("BAR", "job-2") is True
+        assert [job["job_id"] for job in ExecutionSlots.get_all("BAR").values()] == [
+            "job-1"
+        ]
+
+    def test_dispatch_policy_pop_requeues_unstarted_jobs(self, mocker):
+        """
+        Tests if a dispatched job never marked as started goes back to the
+        pending queue once its start timeout expired
+        """
+        PendingQueue.add(name="foo", job_queue="BAR")
+        PendingQueue.add(name="bar", job_queue="BAR")
+        policy = FifoDispatchPolicy()
+        mocker.patch.object(dispatch_policy, "DEFAULT_START_TIMEOUT", -1)
+
+        assert policy.pop("BAR", 5, "job-1").job.name == "foo"
+        dispatch = policy.pop("BAR", 5, "job-2")
+        assert (dispatch.job.name, dispatch.job.job_id) == ("foo", "job-2")
+
+        assert ExecutionSlots.mark_started("BAR", dispatch.job.slot, "job-1") is False
+        assert ExecutionSlots.mark_started("BAR", dispatch.job.slot, "job-2") is True
+        assert policy.pop("BAR", 5, "job-3") is None
+        assert [job.name for job in PendingQueue.get_all()] == ["bar"]
+
+    def test_update_scheduler_entity_status_dispatches_next_job(self, mocker):
+        """
+        Tests if the completion of a job releases its execution slot
+        and dispatches the next job without waiting for the beat
+        """
+        PendingQueue.add(name="foo", job_queue="BAR")
+        dispatch = FifoDispatchPolicy().pop("BAR", 5, "job-id")
+        ExecutingQueue.add(dispatch.job, "job-id")
+        mocker.patch(
+            target(enable_run_entity_task_by_vendor, update_scheduler_entity_status)
+        )
+        mock_run_scheduler = mocker.patch(
+            target(common_run_scheduler_by_vendor, update_scheduler_entity_status)
+        )
+
+        update_scheduler_entity_status(TaskStatus.COMPLETED, "bar", "job-id")
+
+        mock_run_scheduler.assert_called_once_with("BAR")
+        assert ExecutionSlots.count("BAR") == 0
+        assert ExecutingQueue.exists() is False
+
+    def test_update_scheduler_entity_status_without_job_id(self, mocker):
+        """
+        Tests if a completion reported without its celery task id frees the
+        slot of the first executing job of the vendor
+        """
+        PendingQueue.add(name="foo", job_queue="BAR")
+        dispatch = FifoDispatchPolicy().pop("BAR", 5, "job-id")
+        ExecutingQueue.add(dispatch.job, "job-id")
+        mocker.patch(
+            target(enable_run_entity_task_by_vendor, update_scheduler_entity_status)
+        )
+        mocker.patch(
+            target(common_run_scheduler_by_vendor, update_scheduler_entity_status)
+        )
+
+        update_scheduler_entity_status(TaskStatus.COMPLETED, "bar")
+
+        assert ExecutionSlots.count("BAR") == 0
+        assert ExecutingQueue.exists() is False
+
+    def test_update_scheduler_entity_status_without_executing_job(self, mocker):
+        """
+        Tests if the execution slot of a finished job is freed even when
+        it is missing from the executing queue
+        """
+        PendingQueue.add(name="foo", job_queue="BAR")
+        FifoDispatchPolicy().pop("BAR", 5, "job-id")
+        mocker.patch(
+            target(enable_run_entity_task_by_vendor, update_scheduler_entity_status)
+        )
+        mocker.patch(
+            target(common_run_scheduler_by_vendor, update_scheduler_entity_status)
+        )
+
+        update_scheduler_entity_status(TaskStatus.COMPLETED, "bar", "job-id")
+
+        assert ExecutionSlots.count("BAR") == 0
+
     def test_common_run_scheduler_by_vendor_no_pending_jobs(self, mocker):
         """
         Test if there are no pending jobsfor the vendor, the task is not executed
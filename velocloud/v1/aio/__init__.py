@@ -0,0 +1,18 @@
+"""
+Velocloud V1 asyncio endpoint functions
+"""
+
+from ..velocloud import AsyncSBVelocloudV1
+from . import edge, enterprise, enterprise_proxy, licence, profile
+from .concurrency import fan_out, gather_with_concurrency
+
+__all__ = [
+    "AsyncSBVelocloudV1",
+    "edge",
+    "enterprise",
+    "enterprise_proxy",
+    "licence",
+    "profile",
+    "fan_out",
+    "gather_with_concurrency",
+]
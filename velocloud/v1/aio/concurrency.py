@@ -0,0 +1,55 @@
+"""
+Bounded concurrency helpers for the Velocloud V1 asyncio layer
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY: int = 10
+
+
+async def gather_with_concurrency(
+    awaitables: Iterable[Awaitable[T]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[T | BaseException]:
+    """
+    Await all awaitables keeping at most `concurrency` of them in flight.
+    Results are returned in input order, as with asyncio.gather.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(bounded(awaitable) for awaitable in awaitables),
+        return_exceptions=return_exceptions,
+    )
+
+
+async def fan_out(
+    func: Callable[..., Awaitable[R]],
+    client: Any,
+    items: Iterable[Any],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[R | BaseException]:
+    """
+    Call an async endpoint function once per item with bounded concurrency.
+    Example:
+        await fan_out(get_users, client, enterprise_ids, concurrency=20)
+    """
+    return await gather_with_concurrency(
+        (func(client, item) for item in items),
+        concurrency=concurrency,
+        return_exceptions=return_exceptions,
+    )
@@ -0,0 +1,91 @@
+"""
+Velocloud V1 (asyncio)
+/edge
+"""
+
+from typing import List
+
+from common.parsing import evaluate_model
+
+from .. import models
+from ..velocloud import AsyncSBVelocloudV1
+
+
+async def get_edge(
+    client: AsyncSBVelocloudV1, customer_id=None, edge_name=None, edge_logical_id=None
+) -> models.Edge:
+    """
+    API: /edge/getEdge
+    """
+    body = {"with": ["configuration", "site"]}
+    if customer_id is not None:
+        body["enterpriseId"] = customer_id
+    if edge_logical_id is not None:
+        body["logicalId"] = edge_logical_id
+    if edge_name is not None:
+        body["name"] = edge_name
+    data = await client.post_api("/edge/getEdge", body)
+
+    return evaluate_model(models.Edge, data)
+
+
+async def get_configuration_stack(
+    client: AsyncSBVelocloudV1, edge_id, enterprise_id
+) -> List[models.VeloSpecificOperatorConfigurationV1]:
+    """
+    API: /edge/getEdgeConfigurationStack
+    """
+    data = await client.post_api(
+        endpoint="/edge/getEdgeConfigurationStack",
+        body={
+            "edgeId": edge_id,
+            "enterpriseId": enterprise_id,
+            "with": ["modules"],
+        },
+    )
+    return evaluate_model(List[models.VeloSpecificOperatorConfigurationV1], data)
+
+
+async def provision_edge(
+    client: AsyncSBVelocloudV1, body: dict
+) -> models.EdgeProvisionResponse:
+    """
+    API: /edge/edgeProvision
+    """
+    data = await client.post_api(
+        endpoint="/edge/edgeProvision",
+        body=body,
+    )
+    return evaluate_model(models.EdgeProvisionResponse, data)
+
+
+async def delete_edge(
+    client: AsyncSBVelocloudV1, edge_vendor_id, swvc_vendor_id
+) -> List[models.VeloEnterpriseProxyInsertEnterpriseProxyEnterprise]:
+    """
+    API: /edge/deleteEdge
+    """
+    data = await client.post_api(
+        endpoint="/edge/deleteEdge",
+        body={"ids": [edge_vendor_id], "enterpriseId": swvc_vendor_id},
+    )
+    return evaluate_model(
+        List[models.VeloEnterpriseProxyInsertEnterpriseProxyEnterprise], data
+    )
+
+
+async def update_attributes(
+    client: AsyncSBVelocloudV1, swvc_vendor_id, edge_vendor_id, update_dict: dict
+) -> models.DeleteEnterpriseResponse:
+    """
+    API: /edge/updateEdgeAttributes
+    """
+    data = await client.post_api(
+        endpoint="/edge/updateEdgeAttributes",
+        body={
+            "enterpriseId": swvc_vendor_id,
+            "id": edge_vendor_id,
+            "_update": update_dict,
+        },
+    )
+    return evaluate_model(models.DeleteEnterpriseResponse, data)
@@ -0,0 +1,92 @@
+"""
+Velocloud V1 (asyncio)
+/enterpriseProxy API Calls
+"""
+
+from common.parsing import evaluate_model
+
+from .. import models
+from ..velocloud import AsyncSBVelocloudV1
+
+
+async def get_proxy_enterprises(
+    client: AsyncSBVelocloudV1,
+) -> list[models.VeloEnterpriseV1]:
+    """
+    API: enterpriseProxy/getEnterpriseProxyEnterprises
+    """
+    data = await client.post_api(
+        "/enterpriseProxy/getEnterpriseProxyEnterprises",
+        body={"with": ["edges"]},
+    )
+    return evaluate_model(list[models.VeloEnterpriseV1], data)
+
+
+async def get_enterprise_proxy(client: AsyncSBVelocloudV1) -> models.EnterpriseProxy:
+    """
+    API: /enterpriseProxy/getEnterpriseProxy
+    """
+
+    data = await client.post_api(
+        endpoint="/enterpriseProxy/getEnterpriseProxy", body={}
+    )
+    return evaluate_model(models.EnterpriseProxy, data)
+
+
+async def get_cloneable_enterprises(
+    client: AsyncSBVelocloudV1, enterprise_proxy_id: int
+) -> list[models.CloneableEnterprise]:
+    """
+    API: /enterpriseProxy/getEnterpriseProxyCloneableEnterprises
+    """
+    data = await client.post_api(
+        endpoint="/enterpriseProxy/getEnterpriseProxyCloneableEnterprises",
+        body={"enterpriseProxyId": enterprise_proxy_id},
+    )
+
+    return evaluate_model(list[models.CloneableEnterprise], data)
+
+
+async def get_gateway_pools(
+    client: AsyncSBVelocloudV1, enterprise_proxy_id: None | int = None
+) -> list[models.EnterpriseProxyGatewayPool]:
+    """
+    API: /enterpriseProxy/getEnterpriseProxyGatewayPools
+    """
+    data = await client.post_api(
+        endpoint="/enterpriseProxy/getEnterpriseProxyGatewayPools",
+        body={
+            "with": ["gateways", "enterprises"],
+            "enterpriseProxyId": enterprise_proxy_id,
+        },
+    )
+    return evaluate_model(list[models.EnterpriseProxyGatewayPool], data)
+
+
+async def get_operator_profiles(
+    client: AsyncSBVelocloudV1, enterprise_proxy_id: int
+) -> list[models.VeloEnterpriseConfigurationV1]:
+    """
+    API: /enterpriseProxy/getEnterpriseProxyOperatorProfiles
+    """
+    data = await client.post_api(
+        endpoint="/enterpriseProxy/getEnterpriseProxyOperatorProfiles",
+        body={
+            "with": ["modules", "edgeCount"],
+            "enterpriseProxyId": enterprise_proxy_id,
+        },
+    )
+    return evaluate_model(list[models.VeloEnterpriseConfigurationV1], data)
+
+
+async def insert_enterprise(
+    client: AsyncSBVelocloudV1, body: dict
+) -> models.InsertEnterpriseProxyEnterprise:
+    """
+    API: /enterpriseProxy/insertEnterpriseProxyEnterprise
+    """
+    data = await client.post_api(
+        endpoint="/enterpriseProxy/insertEnterpriseProxyEnterprise",
+        body=body,
+    )
+    return evaluate_model(models.InsertEnterpriseProxyEnterprise, data)
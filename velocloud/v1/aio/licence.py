@@ -0,0 +1,37 @@
+"""
+Velocloud V1 (asyncio)
+/licence API Calls
+"""
+
+from common.parsing import evaluate_model
+
+from .. import models
+from ..velocloud import AsyncSBVelocloudV1
+
+
+async def get_edge_licenses(
+    client: AsyncSBVelocloudV1, enterprise_id
+) -> list[models.Licence]:
+    """
+    API: /license/getEnterpriseEdgeLicenses"
+    """
+    data = await client.post_api(
+        endpoint="/license/getEnterpriseEdgeLicenses",
+        body={"enterpriseId": enterprise_id},
+    )
+    return evaluate_model(list[models.Licence], data)
+
+
+async def get_enterprise_proxy_edge_licenses(
+    client: AsyncSBVelocloudV1, enterprise_proxy_id: int | None = None
+) -> list[models.EnterpriseProxyLicense]:
+    """
+    API: /license/getEnterpriseProxyEdgeLicenses
+    """
+    body = {"with": ["counts"]}
+    if enterprise_proxy_id is not None:
+        body["enterpriseProxyId"] = enterprise_proxy_id
+    data = await client.post_api(
+        endpoint="/license/getEnterpriseProxyEdgeLicenses", body=body
+    )
+    return evaluate_model(list[models.EnterpriseProxyLicense], data)
@@ -2,6 +2,7 @@
 Southbound velocloud v1 client
 """
 
+import threading
 from collections.abc import Callable
 
 import httpx
@@ -9,10 +10,16 @@ from structlog import get_logger
 
 log = get_logger()
 
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
 
-class SBVelocloudV1:
+
+class BaseSBVelocloudV1:
     """
-    Velocloud V1 API Operations
+    Velocloud V1 API configuration and response handling
+    shared by the sync and async clients
     """
 
     def __init__(
@@ -21,7 +28,16 @@ class SBVelocloudV1:
         api_key: str | Callable,
         verify_ssl: bool = True,
         vco_index: int = 1,
+        timeout: httpx.Timeout | float = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ):
+        """
+        Velocloud V1 Client Constructor
+        The underlying httpx client is created on first use and kept alive
+        so consecutive calls reuse pooled connections. `http2=True` requires
+        the optional `h2` package.
+        """
         if not api_key:
             raise ValueError("Velocloud token not provided")
 
@@ -30,11 +46,14 @@ class SBVelocloudV1:
         self.base_path = "portal/rest" if self.host[-1] == "/" else "/portal/rest"
         self.verify_ssl = verify_ssl
         self.vco_index = vco_index
+        self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
 
     def __str__(self):
         """Override string representation"""
         return (
-            f"SBVelocloudV1(host={self.host}, api_key=****, "
+            f"{type(self).__name__}(host={self.host}, api_key=****, "
             f"verify_ssl={self.verify_ssl}, vco=vco{self.vco_index})"
         )
 
@@ -42,24 +61,28 @@ class SBVelocloudV1:
         """Override repr string representation (used by str(list[SBVelocloudV1])"""
         return self.__str__()
 
-    def post_api(self, endpoint, body=None):
+    def request_url(self, endpoint: str) -> str:
         """
-        Get Request for API
+        Full URL of a Velocloud V1 endpoint
+        """
+        return self.host + self.base_path + endpoint
+
+    def request_headers(self) -> dict[str, str]:
+        """
+        Authentication headers for a Velocloud V1 request
         """
         if isinstance(self.api_key, str):
             token = self.api_key
         else:
             token = self.api_key()
 
-        headers = {"Authorization": f"Token {token}"}
-        request = httpx.Request(
-            "POST",
-            self.host + self.base_path + endpoint,
-            headers=headers,
-            json=body,
-        )
-        client = httpx.Client()
-        response = client.send(request)
+        return {"Authorization": f"Token {token}"}
+
+    @classmethod
+    def evaluate_response(cls, response: httpx.Response, body=None):
+        """
+        Log HTTP errors and raise on errors returned in the response body
+        """
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -78,7 +101,7 @@ class SBVelocloudV1:
                 message=error_message,
                 request_data=body,
             )
-            nested_error_messages = self._format_error_message(response_json)
+            nested_error_messages = cls._format_error_message(response_json)
             raise httpx.HTTPError(
                 f"Velocloud API Returned Error: {error_message} {nested_error_messages}"
             )
@@ -96,3 +119,107 @@ class SBVelocloudV1:
         if nested_error_messages:
             return error_message + ": " + "; ".join(nested_error_messages)
         return error_message
+
+
+class SBVelocloudV1(BaseSBVelocloudV1):
+    """
+    Velocloud V1 API Operations
+    """
+
+    _client: httpx.Client | None = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._client_lock = threading.Lock()
+
+    def __enter__(self):
+        """Use the client as a context manager"""
+        return self
+
+    def __exit__(self, *_):
+        """Release pooled connections on exit"""
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Persistent pooled HTTP client, (re)created lazily after close()
+        """
+        with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    verify=self.verify_ssl,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    http2=self.http2,
+                )
+            return self._client
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections
+        """
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def post_api(self, endpoint, body=None):
+        """
+        Get Request for API
+        """
+        response = self.client.post(
+            self.request_url(endpoint),
+            headers=self.request_headers(),
+            json=body,
+        )
+        return self.evaluate_response(response, body)
+
+
+class AsyncSBVelocloudV1(BaseSBVelocloudV1):
+    """
+    Velocloud V1 API Operations using asyncio
+    """
+
+    _client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self):
+        """Use the client as an async context manager"""
+        return self
+
+    async def __aexit__(self, *_):
+        """Release pooled connections on exit"""
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Persistent pooled async HTTP client, (re)created lazily after aclose()
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                verify=self.verify_ssl,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled async HTTP client and release its connections
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def post_api(self, endpoint, body=None):
+        """
+        Async Request for API
+        """
+        response = await self.client.post(
+            self.request_url(endpoint),
+            headers=self.request_headers(),
+            json=body,
+        )
+        return self.evaluate_response(response, body)